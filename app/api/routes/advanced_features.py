@@ -3,8 +3,10 @@ Advanced Features API Routes
 Includes bias detection, anonymization, competitive analysis, and candidate ranking
 """
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, load_only
 from typing import List, Optional
+import asyncio
 import uuid
 
 from app.core.database import get_db
@@ -14,10 +16,16 @@ from app.services.bias_detector import get_bias_detector
 from app.services.anonymizer import get_anonymizer
 from app.services.competitive_analyzer import get_competitive_analyzer
 from app.services.candidate_ranker import get_candidate_ranker
+from app.services.job_matcher.matcher_manager import get_job_matcher
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api/v1/advanced", tags=["advanced-features"])
 
+bias_detector = get_bias_detector()
+anonymizer = get_anonymizer()
+competitive_analyzer = get_competitive_analyzer()
+ranker = get_candidate_ranker()
+
 class BiasDetectionResponse(BaseModel):
     resume_id: str
     has_bias: bool
@@ -30,7 +38,7 @@ class BiasDetectionResponse(BaseModel):
     analyzed_at: str
 
 class AnonymizationRequest(BaseModel):
-    resume_id: str
+    resume_id: uuid.UUID
     options: Optional[dict] = None
 
 class AnonymizationResponse(BaseModel):
@@ -40,7 +48,7 @@ class AnonymizationResponse(BaseModel):
     success: bool
 
 class CompetitiveAnalysisRequest(BaseModel):
-    resume_id: str
+    resume_id: uuid.UUID
     job_description: str
     job_title: str
 
@@ -59,7 +67,7 @@ class CompetitiveAnalysisResponse(BaseModel):
     market_insights: List[str]
 
 class CandidateRankingRequest(BaseModel):
-    resume_ids: List[str]
+    resume_ids: List[uuid.UUID]
     job_description: str
     job_title: str
     weights: Optional[dict] = None
@@ -74,7 +82,7 @@ class CandidateRankingResponse(BaseModel):
 
 @router.post("/bias-detection/{resume_id}", response_model=BiasDetectionResponse)
 async def detect_bias(
-    resume_id: str,
+    resume_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
@@ -84,7 +92,7 @@ async def detect_bias(
     Analyzes resume for gender, age, cultural, disability, and other biases
     Returns bias score, risk level, and recommendations
     """
-    resume = db.query(Resume).filter(Resume.id == uuid.UUID(resume_id)).first()
+    resume = db.get(Resume, resume_id)
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -95,11 +103,10 @@ async def detect_bias(
             detail="Resume not yet processed. Please wait for processing to complete."
         )
 
-    bias_detector = get_bias_detector()
     bias_result = bias_detector.detect_bias_in_resume(resume.structured_data)
 
     return BiasDetectionResponse(
-        resume_id=resume_id,
+        resume_id=str(resume_id),
         **bias_result
     )
 
@@ -123,7 +130,7 @@ async def anonymize_resume(
     - remove_company_names: Remove company names (default: False)
     - remove_school_names: Remove school names (default: False)
     """
-    resume = db.query(Resume).filter(Resume.id == uuid.UUID(request.resume_id)).first()
+    resume = db.get(Resume, request.resume_id)
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -134,7 +141,6 @@ async def anonymize_resume(
             detail="Resume not yet processed. Please wait for processing to complete."
         )
 
-    anonymizer = get_anonymizer()
     anonymized_data = anonymizer.anonymize_resume(
         resume.structured_data,
         options=request.options
@@ -146,7 +152,7 @@ async def anonymize_resume(
     )
 
     return AnonymizationResponse(
-        resume_id=request.resume_id,
+        resume_id=str(request.resume_id),
         anonymized_data=anonymized_data,
         anonymization_report=anonymization_report,
         success=True
@@ -164,7 +170,7 @@ async def analyze_competitiveness(
     Compares candidate against industry benchmarks
     Provides market position, strengths, weaknesses, and improvement priorities
     """
-    resume = db.query(Resume).filter(Resume.id == uuid.UUID(request.resume_id)).first()
+    resume = db.get(Resume, request.resume_id)
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -175,7 +181,6 @@ async def analyze_competitiveness(
             detail="Resume not yet processed. Please wait for processing to complete."
         )
 
-    from app.services.job_matcher.matcher_manager import get_job_matcher
     matcher = get_job_matcher()
     match_result = matcher.match_resume_to_job(
         resume_data=resume.structured_data,
@@ -184,7 +189,6 @@ async def analyze_competitiveness(
         company_name=None
     )
 
-    competitive_analyzer = get_competitive_analyzer()
     competitive_result = competitive_analyzer.analyze_competitiveness(
         resume_data=resume.structured_data,
         job_requirements=match_result.get("job_requirements", {}),
@@ -192,7 +196,7 @@ async def analyze_competitiveness(
     )
 
     return CompetitiveAnalysisResponse(
-        resume_id=request.resume_id,
+        resume_id=str(request.resume_id),
         competitive_score=competitive_result['competitive_score'],
         market_position=competitive_result['market_position']['position'],
         industry_benchmark=competitive_result['industry_benchmark'],
@@ -206,7 +210,7 @@ async def analyze_competitiveness(
         market_insights=competitive_result['market_insights']
     )
 
-@router.post("/rank-candidates", response_model=CandidateRankingResponse)
+@router.post("/rank-candidates", response_model=CandidateRankingResponse, response_class=ORJSONResponse)
 async def rank_candidates(
     request: CandidateRankingRequest,
     db: Session = Depends(get_db),
@@ -227,56 +231,73 @@ async def rank_candidates(
     - certifications: 0.05 (default)
     - availability: 0.05 (default)
     """
-    candidates = []
+    matcher = get_job_matcher()
+
+    resumes = {
+        resume.id: resume
+        for resume in db.query(Resume).options(
+            load_only(Resume.id, Resume.structured_data)
+        ).filter(
+            Resume.id.in_(request.resume_ids),
+            Resume.structured_data.isnot(None)
+        ).all()
+    }
 
-    for resume_id in request.resume_ids:
-        try:
-            resume = db.query(Resume).filter(Resume.id == uuid.UUID(resume_id)).first()
+    candidate_resumes = [
+        (str(resume_id), resumes[resume_id])
+        for resume_id in request.resume_ids
+        if resume_id in resumes
+    ]
 
-            if not resume or not resume.structured_data:
-                continue
+    prepared_job = await asyncio.to_thread(
+        matcher.encode_job_description,
+        request.job_description,
+        request.job_title
+    )
 
-            from app.services.job_matcher.matcher_manager import get_job_matcher
-            matcher = get_job_matcher()
-            match_result = matcher.match_resume_to_job(
+    match_results = await asyncio.gather(
+        *[
+            asyncio.to_thread(
+                matcher.match_resume_to_job,
                 resume_data=resume.structured_data,
                 job_description=request.job_description,
                 job_title=request.job_title,
-                company_name=None
+                company_name=None,
+                prepared_job=prepared_job
             )
+            for _, resume in candidate_resumes
+        ],
+        return_exceptions=True
+    )
 
-            candidates.append({
-                'resume_id': resume_id,
-                'resume_data': resume.structured_data,
-                'match_data': match_result,
-                'availability': 'unknown'
-            })
-
-        except Exception as e:
+    candidates = []
+    for (resume_id, resume), match_result in zip(candidate_resumes, match_results):
+        if isinstance(match_result, Exception):
             continue
 
+        candidates.append({
+            'resume_id': resume_id,
+            'resume_data': resume.structured_data,
+            'match_data': match_result,
+            'availability': 'unknown'
+        })
+
     if not candidates:
         raise HTTPException(
             status_code=400,
             detail="No valid candidates found with processed resumes"
         )
 
-    ranker = get_candidate_ranker()
-
-    from app.services.job_matcher.job_parser import JobDescriptionParser
-    job_parser = JobDescriptionParser()
-    job_requirements = job_parser.parse_job_description(
-        request.job_description,
-        request.job_title
-    )
-
     ranking_result = ranker.rank_candidates(
         candidates=candidates,
-        job_requirements=job_requirements,
+        job_requirements=prepared_job["job_requirements"],
         weights=request.weights
     )
 
-    return CandidateRankingResponse(**ranking_result)
+    return ORJSONResponse({
+        field: ranking_result[field]
+        for field in CandidateRankingResponse.model_fields
+    })
 
 @router.get("/bias-detection/job-description", response_model=dict)
 async def detect_job_description_bias(
@@ -289,15 +310,14 @@ async def detect_job_description_bias(
     Analyzes job description for biased language
     Provides inclusive language score and recommendations
     """
-    bias_detector = get_bias_detector()
     bias_result = bias_detector.detect_bias_in_job_description(job_description)
 
     return bias_result
 
 @router.post("/candidate-comparison")
 async def compare_candidates(
-    candidate1_id: str,
-    candidate2_id: str,
+    candidate1_id: uuid.UUID,
+    candidate2_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
@@ -307,8 +327,17 @@ async def compare_candidates(
     Provides side-by-side comparison of scores and strengths
     Works with both resumes (with or without job matches)
     """
-    resume1 = db.query(Resume).filter(Resume.id == uuid.UUID(candidate1_id)).first()
-    resume2 = db.query(Resume).filter(Resume.id == uuid.UUID(candidate2_id)).first()
+    candidate_ids = [candidate1_id, candidate2_id]
+
+    resumes = {
+        resume.id: resume
+        for resume in db.query(Resume).options(
+            load_only(Resume.id, Resume.structured_data)
+        ).filter(Resume.id.in_(candidate_ids)).all()
+    }
+
+    resume1 = resumes.get(candidate1_id)
+    resume2 = resumes.get(candidate2_id)
 
     if not resume1 or not resume2:
         raise HTTPException(
@@ -316,25 +345,30 @@ async def compare_candidates(
             detail="One or both candidates not found"
         )
 
-    job_match1 = db.query(ResumeJobMatch).filter(
-        ResumeJobMatch.resume_id == uuid.UUID(candidate1_id)
-    ).first()
-
-    job_match2 = db.query(ResumeJobMatch).filter(
-        ResumeJobMatch.resume_id == uuid.UUID(candidate2_id)
-    ).first()
+    job_matches = {
+        match.resume_id: match
+        for match in db.query(ResumeJobMatch).options(
+            load_only(ResumeJobMatch.resume_id, ResumeJobMatch.overall_score, ResumeJobMatch.category_scores)
+        ).filter(
+            ResumeJobMatch.resume_id.in_(candidate_ids)
+        ).distinct(ResumeJobMatch.resume_id).order_by(
+            ResumeJobMatch.resume_id,
+            ResumeJobMatch.matched_at.desc()
+        ).all()
+    }
 
-    ranker = get_candidate_ranker()
+    job_match1 = job_matches.get(candidate1_id)
+    job_match2 = job_matches.get(candidate2_id)
 
     candidate1_data = {
-        'resume_id': candidate1_id,
+        'resume_id': str(candidate1_id),
         'final_score': job_match1.overall_score if job_match1 else 0.0,
         'category_scores': job_match1.category_scores if job_match1 else {},
         'structured_data': resume1.structured_data or {}
     }
 
     candidate2_data = {
-        'resume_id': candidate2_id,
+        'resume_id': str(candidate2_id),
         'final_score': job_match2.overall_score if job_match2 else 0.0,
         'category_scores': job_match2.category_scores if job_match2 else {},
         'structured_data': resume2.structured_data or {}
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, delete, func, and_, tuple_
 from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime, timedelta
@@ -6,115 +8,133 @@ import uuid
 
 from app.core.database import get_db
 from app.core.security import verify_password
+from app.core.pagination import encode_cursor, decode_cursor
 from app.models.database import ResumeParserErrorLog
 
 router = APIRouter(prefix="/api/v1/error-logs", tags=["error-logs"])
 
-@router.get("")
+@router.get("", response_class=ORJSONResponse)
 async def get_all_error_logs(
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
     severity: Optional[str] = None,
     is_resolved: Optional[bool] = None,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    query = db.query(ResumeParserErrorLog)
+    query = select(
+        ResumeParserErrorLog.id,
+        ResumeParserErrorLog.resume_id,
+        ResumeParserErrorLog.error_type,
+        ResumeParserErrorLog.error_message,
+        ResumeParserErrorLog.extractor_name,
+        ResumeParserErrorLog.severity,
+        ResumeParserErrorLog.is_resolved,
+        ResumeParserErrorLog.created_at,
+        ResumeParserErrorLog.resolved_at
+    )
 
     if severity:
-        query = query.filter(ResumeParserErrorLog.severity == severity)
+        query = query.where(ResumeParserErrorLog.severity == severity)
 
     if is_resolved is not None:
-        query = query.filter(ResumeParserErrorLog.is_resolved == is_resolved)
-
-    error_logs = query.order_by(
-        ResumeParserErrorLog.created_at.desc()
-    ).limit(limit).all()
-
-    return {
-        "error_logs": [
-            {
-                "id": str(log.id),
-                "resume_id": str(log.resume_id) if log.resume_id else None,
-                "error_type": log.error_type,
-                "error_message": log.error_message,
-                "extractor_name": log.extractor_name,
-                "severity": log.severity,
-                "is_resolved": log.is_resolved,
-                "created_at": log.created_at,
-                "resolved_at": log.resolved_at
-            }
-            for log in error_logs
-        ],
+        query = query.where(ResumeParserErrorLog.is_resolved == is_resolved)
+
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(ResumeParserErrorLog.created_at, ResumeParserErrorLog.id) < (cursor_created_at, cursor_id)
+        )
+
+    error_logs = db.execute(
+        query.order_by(
+            ResumeParserErrorLog.created_at.desc(),
+            ResumeParserErrorLog.id.desc()
+        ).limit(limit)
+    ).mappings().all()
+
+    next_cursor = None
+    if len(error_logs) == limit and error_logs[-1]["created_at"]:
+        next_cursor = encode_cursor(error_logs[-1]["created_at"], error_logs[-1]["id"])
+
+    return ORJSONResponse({
+        "error_logs": [dict(log) for log in error_logs],
         "count": len(error_logs),
+        "next_cursor": next_cursor,
         "filters": {"severity": severity, "is_resolved": is_resolved}
-    }
+    })
 
 @router.get("/stats")
 async def get_error_log_stats(
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    total_errors = db.query(ResumeParserErrorLog).count()
-    unresolved_errors = db.query(ResumeParserErrorLog).filter(
-        ResumeParserErrorLog.is_resolved == False
-    ).count()
-    critical_errors = db.query(ResumeParserErrorLog).filter(
-        ResumeParserErrorLog.severity == 'critical',
-        ResumeParserErrorLog.is_resolved == False
-    ).count()
-
-    error_types = db.query(
-        ResumeParserErrorLog.error_type,
-        db.func.count(ResumeParserErrorLog.id)
-    ).group_by(ResumeParserErrorLog.error_type).all()
+    totals = db.execute(
+        select(
+            func.count().label("total_errors"),
+            func.count().filter(
+                ResumeParserErrorLog.is_resolved == False
+            ).label("unresolved_errors"),
+            func.count().filter(
+                and_(
+                    ResumeParserErrorLog.severity == 'critical',
+                    ResumeParserErrorLog.is_resolved == False
+                )
+            ).label("critical_errors")
+        ).select_from(ResumeParserErrorLog)
+    ).one()
+
+    error_types = db.execute(
+        select(
+            ResumeParserErrorLog.error_type,
+            func.count(ResumeParserErrorLog.id)
+        ).group_by(ResumeParserErrorLog.error_type)
+    ).all()
 
     return {
-        "total_errors": total_errors,
-        "unresolved_errors": unresolved_errors,
-        "critical_errors": critical_errors,
+        "total_errors": totals.total_errors,
+        "unresolved_errors": totals.unresolved_errors,
+        "critical_errors": totals.critical_errors,
         "error_types": {error_type: count for error_type, count in error_types}
     }
 
-@router.get("/resumes/{resume_id}")
+@router.get("/resumes/{resume_id}", response_class=ORJSONResponse)
 async def get_resume_error_logs(
-    resume_id: str,
+    resume_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    error_logs = db.query(ResumeParserErrorLog).filter(
-        ResumeParserErrorLog.resume_id == uuid.UUID(resume_id)
-    ).order_by(ResumeParserErrorLog.created_at.desc()).all()
-
-    return {
+    error_logs = db.execute(
+        select(
+            ResumeParserErrorLog.id,
+            ResumeParserErrorLog.error_type,
+            ResumeParserErrorLog.error_message,
+            ResumeParserErrorLog.stack_trace,
+            ResumeParserErrorLog.extractor_name,
+            ResumeParserErrorLog.input_data,
+            ResumeParserErrorLog.context,
+            ResumeParserErrorLog.severity,
+            ResumeParserErrorLog.is_resolved,
+            ResumeParserErrorLog.created_at,
+            ResumeParserErrorLog.resolved_at
+        )
+        .where(ResumeParserErrorLog.resume_id == resume_id)
+        .order_by(ResumeParserErrorLog.created_at.desc())
+    ).mappings().all()
+
+    return ORJSONResponse({
         "resume_id": resume_id,
-        "error_logs": [
-            {
-                "id": str(log.id),
-                "error_type": log.error_type,
-                "error_message": log.error_message,
-                "stack_trace": log.stack_trace,
-                "extractor_name": log.extractor_name,
-                "input_data": log.input_data,
-                "context": log.context,
-                "severity": log.severity,
-                "is_resolved": log.is_resolved,
-                "created_at": log.created_at,
-                "resolved_at": log.resolved_at
-            }
-            for log in error_logs
-        ],
+        "error_logs": [dict(log) for log in error_logs],
         "count": len(error_logs)
-    }
+    })
 
 @router.put("/{error_log_id}/resolve")
 async def resolve_error_log(
-    error_log_id: str,
+    error_log_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    error_log = db.query(ResumeParserErrorLog).filter(
-        ResumeParserErrorLog.id == uuid.UUID(error_log_id)
-    ).first()
+    error_log = db.get(ResumeParserErrorLog, error_log_id)
 
     if not error_log:
         raise HTTPException(status_code=404, detail="Error log not found")
@@ -137,13 +157,14 @@ async def cleanup_old_error_logs(
     authenticated: bool = Depends(verify_password)
 ):
     cutoff_date = datetime.utcnow() - timedelta(days=days_old)
-    query = db.query(ResumeParserErrorLog).filter(ResumeParserErrorLog.created_at < cutoff_date)
+    stmt = delete(ResumeParserErrorLog).where(ResumeParserErrorLog.created_at < cutoff_date)
 
     if resolved_only:
-        query = query.filter(ResumeParserErrorLog.is_resolved == True)
+        stmt = stmt.where(ResumeParserErrorLog.is_resolved == True)
 
-    deleted_count = query.delete()
+    result = db.execute(stmt.execution_options(synchronize_session=False))
     db.commit()
+    deleted_count = result.rowcount
 
     return {
         "message": f"Deleted {deleted_count} old error logs",
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, load_only
+from typing import List, Optional
 import uuid
 
 from app.core.database import get_db
 from app.core.security import verify_password
+from app.core.pagination import encode_cursor, decode_cursor
 from app.models.database import Resume, ResumeJobMatch
 from app.schemas.job_match import JobMatchRequest, JobMatchResponse, JobMatchDetailResponse
 from app.services.job_matcher.matcher_manager import get_job_matcher
@@ -18,7 +20,7 @@ async def match_resume_to_job(
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    resume = db.query(Resume).filter(Resume.id == uuid.UUID(match_request.resume_id)).first()
+    resume = db.get(Resume, match_request.resume_id)
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -53,8 +55,7 @@ async def match_resume_to_job(
             "skill_analysis": match_result["skill_analysis"],
             "experience_analysis": match_result["experience_analysis"],
             "education_match": match_result["education_match"]
-        },
-        matched_at=datetime.utcnow()
+        }
     )
 
     db.add(job_match)
@@ -75,11 +76,11 @@ async def match_resume_to_job(
 
 @router.get("/matches/{match_id}", response_model=JobMatchDetailResponse)
 async def get_match_details(
-    match_id: str,
+    match_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    job_match = db.query(ResumeJobMatch).filter(ResumeJobMatch.id == uuid.UUID(match_id)).first()
+    job_match = db.get(ResumeJobMatch, match_id)
 
     if not job_match:
         raise HTTPException(status_code=404, detail="Job match not found")
@@ -104,38 +105,67 @@ async def get_match_details(
         matched_at=job_match.matched_at
     )
 
-@router.get("/resumes/{resume_id}/matches", response_model=List[JobMatchResponse])
+@router.get("/resumes/{resume_id}/matches", response_model=List[JobMatchResponse], response_class=ORJSONResponse)
 async def get_resume_matches(
-    resume_id: str,
+    resume_id: uuid.UUID,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    matches = db.query(ResumeJobMatch).filter(
-        ResumeJobMatch.resume_id == uuid.UUID(resume_id)
-    ).order_by(ResumeJobMatch.matched_at.desc()).all()
-
-    return [
-        JobMatchResponse(
-            id=str(match.id),
-            resume_id=str(match.resume_id),
-            job_title=match.job_title,
-            company_name=match.company_name,
-            overall_score=match.overall_score,
-            confidence_score=float(match.confidence_score),
-            recommendation=match.recommendation,
-            category_scores=match.category_scores or {},
-            matched_at=match.matched_at
+    matches = db.query(ResumeJobMatch).options(
+        load_only(
+            ResumeJobMatch.id,
+            ResumeJobMatch.resume_id,
+            ResumeJobMatch.job_title,
+            ResumeJobMatch.company_name,
+            ResumeJobMatch.overall_score,
+            ResumeJobMatch.confidence_score,
+            ResumeJobMatch.recommendation,
+            ResumeJobMatch.category_scores,
+            ResumeJobMatch.matched_at
         )
+    ).filter(
+        ResumeJobMatch.resume_id == resume_id
+    )
+
+    if cursor:
+        cursor_matched_at, cursor_id = decode_cursor(cursor)
+        matches = matches.filter(
+            tuple_(ResumeJobMatch.matched_at, ResumeJobMatch.id) < (cursor_matched_at, cursor_id)
+        )
+
+    matches = matches.order_by(
+        ResumeJobMatch.matched_at.desc(),
+        ResumeJobMatch.id.desc()
+    ).limit(limit).all()
+
+    headers = {}
+    if len(matches) == limit and matches[-1].matched_at:
+        headers["X-Next-Cursor"] = encode_cursor(matches[-1].matched_at, matches[-1].id)
+
+    return ORJSONResponse([
+        {
+            "id": match.id,
+            "resume_id": match.resume_id,
+            "job_title": match.job_title,
+            "company_name": match.company_name,
+            "overall_score": float(match.overall_score),
+            "confidence_score": float(match.confidence_score),
+            "recommendation": match.recommendation,
+            "category_scores": match.category_scores or {},
+            "matched_at": match.matched_at
+        }
         for match in matches
-    ]
+    ], headers=headers)
 
 @router.delete("/matches/{match_id}")
 async def delete_job_match(
-    match_id: str,
+    match_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    job_match = db.query(ResumeJobMatch).filter(ResumeJobMatch.id == uuid.UUID(match_id)).first()
+    job_match = db.get(ResumeJobMatch, match_id)
 
     if not job_match:
         raise HTTPException(status_code=404, detail="Job match not found")
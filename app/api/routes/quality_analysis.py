@@ -1,19 +1,20 @@
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 from typing import Optional
+import asyncio
 import uuid
 
 from app.core.database import get_db
 from app.core.security import verify_password
 from app.models.database import Resume, AIAnalysis
 from app.services.quality_analyzer import get_quality_analyzer
-from datetime import datetime
 
 router = APIRouter(prefix="/api/v1/quality", tags=["quality-analysis"])
 
 @router.post("/analyze/{resume_id}")
 async def analyze_resume_quality(
-    resume_id: str,
+    resume_id: uuid.UUID,
     target_role: Optional[str] = None,
     location: Optional[str] = "US",
     db: Session = Depends(get_db),
@@ -26,7 +27,7 @@ async def analyze_resume_quality(
     - **target_role**: Optional target job role for tailored suggestions
     - **location**: Location for salary estimation (default: US)
     """
-    resume = db.query(Resume).filter(Resume.id == uuid.UUID(resume_id)).first()
+    resume = db.get(Resume, resume_id)
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -42,54 +43,38 @@ async def analyze_resume_quality(
 
     analyzer = get_quality_analyzer()
 
-    quality_analysis = analyzer.analyze_quality(resume.structured_data)
-    salary_estimate = analyzer.estimate_salary_range(resume.structured_data, location)
-    improvement_plan = analyzer.generate_improvement_plan(resume.structured_data, target_role)
-
-    existing_analysis = db.query(AIAnalysis).filter(
-        AIAnalysis.resume_id == uuid.UUID(resume_id)
-    ).first()
-
-    if existing_analysis:
-        existing_analysis.quality_score = quality_analysis.get("quality_score", 0)
-        existing_analysis.completeness_score = quality_analysis.get("completeness_score", 0)
-        existing_analysis.industry_classifications = quality_analysis.get("industry_classifications", [])
-        existing_analysis.career_level = quality_analysis.get("career_level", "Unknown")
-        existing_analysis.salary_estimate = salary_estimate
-        existing_analysis.suggestions = {
+    quality_analysis, salary_estimate, improvement_plan = await asyncio.gather(
+        asyncio.to_thread(analyzer.analyze_quality, resume.structured_data),
+        asyncio.to_thread(analyzer.estimate_salary_range, resume.structured_data, location),
+        asyncio.to_thread(analyzer.generate_improvement_plan, resume.structured_data, target_role)
+    )
+
+    values = {
+        "quality_score": quality_analysis.get("quality_score", 0),
+        "completeness_score": quality_analysis.get("completeness_score", 0),
+        "industry_classifications": quality_analysis.get("industry_classifications", []),
+        "career_level": quality_analysis.get("career_level", "Unknown"),
+        "salary_estimate": salary_estimate,
+        "suggestions": {
             "quality_analysis": quality_analysis,
             "improvement_plan": improvement_plan
-        }
-        existing_analysis.confidence_scores = {
+        },
+        "confidence_scores": {
             "ats_compatibility": quality_analysis.get("ats_compatibility_score", 0),
             "salary_confidence": salary_estimate.get("confidence", "low")
         }
-        db.commit()
-        db.refresh(existing_analysis)
-        analysis = existing_analysis
-    else:
-        analysis = AIAnalysis(
-            resume_id=uuid.UUID(resume_id),
-            quality_score=quality_analysis.get("quality_score", 0),
-            completeness_score=quality_analysis.get("completeness_score", 0),
-            industry_classifications=quality_analysis.get("industry_classifications", []),
-            career_level=quality_analysis.get("career_level", "Unknown"),
-            salary_estimate=salary_estimate,
-            suggestions={
-                "quality_analysis": quality_analysis,
-                "improvement_plan": improvement_plan
-            },
-            confidence_scores={
-                "ats_compatibility": quality_analysis.get("ats_compatibility_score", 0),
-                "salary_confidence": salary_estimate.get("confidence", "low")
-            },
-            created_at=datetime.utcnow()
-        )
-        db.add(analysis)
-        db.commit()
-        db.refresh(analysis)
+    }
 
-    return {
+    stmt = insert(AIAnalysis).values(resume_id=resume_id, **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AIAnalysis.resume_id],
+        set_={key: stmt.excluded[key] for key in values}
+    ).returning(AIAnalysis)
+
+    analysis = db.execute(stmt).scalar_one()
+
+    # Built before commit so the expiring commit doesn't trigger a reload SELECT
+    response = {
         "id": str(analysis.id),
         "resume_id": resume_id,
         "quality_score": analysis.quality_score,
@@ -102,16 +87,19 @@ async def analyze_resume_quality(
         "confidence_scores": analysis.confidence_scores,
         "created_at": analysis.created_at
     }
+    db.commit()
+
+    return response
 
 @router.get("/{resume_id}")
 async def get_quality_analysis(
-    resume_id: str,
+    resume_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
     """Get existing quality analysis for a resume"""
     analysis = db.query(AIAnalysis).filter(
-        AIAnalysis.resume_id == uuid.UUID(resume_id)
+        AIAnalysis.resume_id == resume_id
     ).first()
 
     if not analysis:
@@ -135,13 +123,13 @@ async def get_quality_analysis(
 
 @router.delete("/{resume_id}")
 async def delete_quality_analysis(
-    resume_id: str,
+    resume_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
     """Delete quality analysis for a resume"""
     analysis = db.query(AIAnalysis).filter(
-        AIAnalysis.resume_id == uuid.UUID(resume_id)
+        AIAnalysis.resume_id == resume_id
     ).first()
 
     if not analysis:
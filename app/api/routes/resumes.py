@@ -1,101 +1,113 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, BackgroundTasks
-from sqlalchemy.orm import Session
-from typing import Optional
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, BackgroundTasks, Request, Query
+from pydantic import ValidationError
+from sqlalchemy import select, update, func, cast, tuple_, bindparam, literal_column, Text
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy.dialects.postgresql import insert, ARRAY, JSONB
+from typing import List, Optional
 from pathlib import Path
+import asyncio
+import hashlib
+import logging
 import os
 import shutil
 import uuid
 
-from app.core.database import get_db, SessionLocal
+import aiofiles
+import redis.asyncio as redis
+
+from app.core.database import get_db
 from app.core.security import verify_password
-from app.models.database import Resume
-from app.schemas.resume import ResumeUploadResponse, ResumeResponse, ResumeStatusResponse
-from app.services.resume_parser.parser_manager import get_resume_parser
+from app.core.pagination import encode_cursor, decode_cursor
+from app.models.database import Resume, utc_now
+from app.schemas.resume import ResumeUploadResponse, ResumeResponse, ResumeStatusResponse, JsonPatchOp
+from app.services.resume_processor import process_resume_file
 from app.services.malware_scanner import get_malware_scanner
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/v1/resumes", tags=["resumes"])
 
 UPLOAD_DIR = "uploads"
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_WRITE_BATCH_SIZE = 1024 * 1024
 Path(UPLOAD_DIR).mkdir(exist_ok=True)
 
-async def process_resume_background_async(resume_id: str, file_path: str):
-    """Background task to process resume after upload"""
-    db = SessionLocal()
-    try:
-        from app.services.document_loader import load_single_document
-
-        resume = db.query(Resume).filter(Resume.id == uuid.UUID(resume_id)).first()
-        if not resume:
-            return
-
-        resume.status = 'processing'
-        db.commit()
-
-        documents = load_single_document(file_path)
-        if documents:
-            raw_text = " ".join([doc.page_content for doc in documents])
-            resume.raw_text = raw_text
-
-            parser = get_resume_parser()
-            structured_data = await parser.parse_resume_async(raw_text, resume_id=resume_id, db=db)
-
-            resume.structured_data = structured_data
-            resume.status = 'completed'
-            resume.processed_at = datetime.utcnow()
-        else:
-            resume.status = 'failed'
-
-        db.commit()
-
-    except Exception as e:
-        resume.status = 'failed'
-        db.commit()
-        from app.services.resume_parser.error_logger import ResumeParserErrorLogger
-        ResumeParserErrorLogger.log_error(
-            db, e, "resume_parsing_failed", "BackgroundTask",
-            resume_id, {"file_path": file_path}, None, "critical"
-        )
-    finally:
-        db.close()
-
-def process_resume_background(resume_id: str, file_path: str):
-    """Wrapper to run async function in background"""
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    loop.run_until_complete(process_resume_background_async(resume_id, file_path))
+UPSERT_RESUME = (
+    insert(Resume)
+    .values(
+        id=bindparam("id"),
+        file_name=bindparam("file_name"),
+        file_path=bindparam("file_path"),
+        file_hash=bindparam("file_hash"),
+        file_size=bindparam("file_size"),
+        file_type=bindparam("file_type"),
+        status="pending"
+    )
+    .on_conflict_do_update(
+        index_elements=[Resume.file_hash],
+        set_={"file_hash": Resume.file_hash}
+    )
+    .returning(
+        Resume.id,
+        Resume.file_name,
+        Resume.status,
+        Resume.uploaded_at,
+        literal_column("xmax = 0").label("inserted")
+    )
+)
+
+def _patch_structured_data(ops: List[JsonPatchOp]):
+    """Build a nested jsonb_set expression so only the patched keys are rewritten"""
+    expr = func.coalesce(Resume.structured_data, cast({}, JSONB))
+    for op in ops:
+        expr = func.jsonb_set(expr, cast(op.path, ARRAY(Text)), cast(op.value, JSONB), type_=JSONB)
+    return expr
 
 @router.post("/upload", response_model=ResumeUploadResponse)
 async def upload_resume(
+    request: Request,
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    allowed_extensions = {'.pdf', '.docx', '.doc', '.txt'}
     file_extension = Path(file.filename).suffix.lower()
 
-    if file_extension not in allowed_extensions:
+    if file_extension not in settings.ALLOWED_EXTENSIONS_SET:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type: {file_extension}. Allowed: {', '.join(allowed_extensions)}"
+            detail=f"Unsupported file type: {file_extension}. Allowed: {', '.join(sorted(settings.ALLOWED_EXTENSIONS_SET))}"
         )
 
-    file_path = os.path.join(UPLOAD_DIR, file.filename)
-
-    file_content = await file.read()
-    with open(file_path, "wb") as buffer:
-        buffer.write(file_content)
-
-    file_size = os.path.getsize(file_path)
-
-    if file_size > settings.MAX_FILE_SIZE_MB * 1024 * 1024:
+    resume_id = uuid.uuid4()
+    file_path = os.path.join(UPLOAD_DIR, f"{resume_id}{file_extension}")
+
+    max_file_size = settings.MAX_FILE_SIZE_MB * 1024 * 1024
+    # Dedup hash is MD5(content + filename), matching the hashes already stored in resumes.file_hash
+    hasher = hashlib.md5()
+    file_size = 0
+
+    pending_chunks = []
+    pending_size = 0
+
+    async with aiofiles.open(file_path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > max_file_size:
+                break
+            hasher.update(chunk)
+            pending_chunks.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= UPLOAD_WRITE_BATCH_SIZE:
+                await buffer.writelines(pending_chunks)
+                pending_chunks = []
+                pending_size = 0
+
+        if pending_chunks and file_size <= max_file_size:
+            await buffer.writelines(pending_chunks)
+
+    if file_size > max_file_size:
         os.remove(file_path)
         raise HTTPException(
             status_code=400,
@@ -103,7 +115,9 @@ async def upload_resume(
         )
 
     scanner = get_malware_scanner()
-    scan_result = scanner.scan_file(file_path, file.filename, settings.MAX_FILE_SIZE_MB)
+    scan_result = await asyncio.to_thread(
+        scanner.scan_file, file_path, file.filename, settings.MAX_FILE_SIZE_MB, file_size
+    )
 
     if not scan_result['is_safe']:
         os.remove(file_path)
@@ -116,37 +130,42 @@ async def upload_resume(
             }
         )
 
-    parser = get_resume_parser()
-    file_hash = parser.generate_resume_hash(file_content, file.filename)
+    hasher.update(file.filename.encode('utf-8'))
+    file_hash = hasher.hexdigest()
 
-    existing_resume = db.query(Resume).filter(Resume.file_hash == file_hash).first()
+    resume = db.execute(UPSERT_RESUME, {
+        "id": resume_id,
+        "file_name": file.filename,
+        "file_path": file_path,
+        "file_hash": file_hash,
+        "file_size": file_size,
+        "file_type": file_extension[1:]
+    }).one()
+    db.commit()
 
-    if existing_resume:
+    if not resume.inserted:
         os.remove(file_path)
 
         return ResumeUploadResponse(
-            id=str(existing_resume.id),
+            id=str(resume.id),
             message=f"Resume '{file.filename}' already exists. Returning existing record.",
-            filename=existing_resume.file_name,
-            status=existing_resume.status,
-            uploaded_at=existing_resume.uploaded_at
+            filename=resume.file_name,
+            status=resume.status,
+            uploaded_at=resume.uploaded_at
         )
 
-    resume = Resume(
-        file_name=file.filename,
-        file_path=file_path,
-        file_hash=file_hash,
-        file_size=file_size,
-        file_type=file_extension[1:],
-        status='pending',
-        uploaded_at=datetime.utcnow()
-    )
-
-    db.add(resume)
-    db.commit()
-    db.refresh(resume)
+    arq_pool = getattr(request.app.state, "arq_pool", None)
+    queued = False
+    if arq_pool is not None:
+        try:
+            await arq_pool.enqueue_job("process_resume", str(resume.id), file_path)
+            queued = True
+        except (redis.RedisError, OSError) as e:
+            # The row is already committed as pending, so process it here rather than strand it
+            logger.warning(f"Resume queue unavailable, processing {resume.id} in-process: {e}")
 
-    background_tasks.add_task(process_resume_background, str(resume.id), file_path)
+    if not queued:
+        background_tasks.add_task(process_resume_file, str(resume.id), file_path)
 
     return ResumeUploadResponse(
         id=str(resume.id),
@@ -158,11 +177,11 @@ async def upload_resume(
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
 async def get_resume(
-    resume_id: str,
+    resume_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    resume = db.query(Resume).filter(Resume.id == uuid.UUID(resume_id)).first()
+    resume = db.get(Resume, resume_id)
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -182,22 +201,33 @@ async def get_resume(
 
 @router.put("/{resume_id}")
 async def update_resume(
-    resume_id: str,
+    resume_id: uuid.UUID,
     updated_data: dict,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    resume = db.query(Resume).filter(Resume.id == uuid.UUID(resume_id)).first()
+    values = {"updated_at": utc_now()}
+    if "structured_data" in updated_data:
+        values["structured_data"] = updated_data["structured_data"]
+    elif "json_patch" in updated_data:
+        try:
+            ops = [JsonPatchOp(**op) for op in updated_data["json_patch"]]
+        except (TypeError, ValidationError):
+            raise HTTPException(status_code=400, detail="Invalid json_patch: expected a list of {path, value} objects")
+        if ops:
+            values["structured_data"] = _patch_structured_data(ops)
+
+    resume = db.execute(
+        update(Resume)
+        .where(Resume.id == resume_id)
+        .values(**values)
+        .returning(Resume.id, Resume.updated_at)
+    ).first()
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    if "structured_data" in updated_data:
-        resume.structured_data = updated_data["structured_data"]
-
-    resume.updated_at = datetime.utcnow()
     db.commit()
-    db.refresh(resume)
 
     return {
         "message": "Resume updated successfully",
@@ -207,11 +237,11 @@ async def update_resume(
 
 @router.delete("/{resume_id}")
 async def delete_resume(
-    resume_id: str,
+    resume_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    resume = db.query(Resume).filter(Resume.id == uuid.UUID(resume_id)).first()
+    resume = db.get(Resume, resume_id, options=[load_only(Resume.file_path, Resume.file_name)])
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -239,11 +269,11 @@ async def delete_resume(
 
 @router.get("/{resume_id}/status", response_model=ResumeStatusResponse)
 async def get_resume_status(
-    resume_id: str,
+    resume_id: uuid.UUID,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    resume = db.query(Resume).filter(Resume.id == uuid.UUID(resume_id)).first()
+    resume = db.get(Resume, resume_id, options=[load_only(Resume.status, Resume.processed_at)])
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -264,25 +294,50 @@ async def get_resume_status(
 
 @router.get("/")
 async def list_resumes(
-    skip: int = 0,
-    limit: int = 10,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     authenticated: bool = Depends(verify_password)
 ):
-    """List all uploaded resumes with pagination"""
-    resumes = db.query(Resume).offset(skip).limit(limit).all()
+    """List all uploaded resumes, newest first, with keyset pagination
+
+    skip is still accepted for older clients but can't be combined with cursor.
+    """
+    if skip and cursor:
+        raise HTTPException(status_code=400, detail="Use either skip or cursor, not both")
+
+    query = select(
+        Resume.id,
+        Resume.file_name,
+        Resume.status,
+        Resume.uploaded_at,
+        Resume.processed_at
+    )
+
+    if cursor:
+        cursor_uploaded_at, cursor_id = decode_cursor(cursor)
+        query = query.where(tuple_(Resume.uploaded_at, Resume.id) < (cursor_uploaded_at, cursor_id))
+
+    resumes = db.execute(
+        query.order_by(Resume.uploaded_at.desc(), Resume.id.desc()).offset(skip).limit(limit)
+    ).mappings().all()
+
+    next_cursor = None
+    if len(resumes) == limit and resumes[-1]["uploaded_at"]:
+        next_cursor = encode_cursor(resumes[-1]["uploaded_at"], resumes[-1]["id"])
 
     return {
         "count": len(resumes),
+        "next_cursor": next_cursor,
         "resumes": [
             {
-                "id": str(resume.id),
-                "file_name": resume.file_name,
-                "status": resume.status,
-                "uploaded_at": resume.uploaded_at,
-                "processed_at": resume.processed_at
+                "id": str(resume["id"]),
+                "file_name": resume["file_name"],
+                "status": resume["status"],
+                "uploaded_at": resume["uploaded_at"],
+                "processed_at": resume["processed_at"]
             }
             for resume in resumes
         ]
     }
-
@@ -1,4 +1,5 @@
 import os
+from functools import cached_property
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -13,6 +14,13 @@ class Settings(BaseSettings):
     DB_HOST: str = "localhost"
     DB_PORT: int = 5432
     DB_NAME: str = "hackathon"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_BACKGROUND_POOL_SIZE: int = 10
+
+    REDIS_URL: str = "redis://localhost:6379/0"
 
     FLAIR_MODEL_NAME: str = "flair/ner-english-large"
     FLAIR_CACHE_DIR: str = "./models/flair_cache"
@@ -48,10 +56,14 @@ class Settings(BaseSettings):
     def DATABASE_URL(self) -> str:
         return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
-    @property
+    @cached_property
     def ALLOWED_EXTENSIONS_LIST(self) -> list:
         return [ext.strip() for ext in self.ALLOWED_EXTENSIONS.split(',')]
 
+    @cached_property
+    def ALLOWED_EXTENSIONS_SET(self) -> frozenset:
+        return frozenset(f".{ext.lower()}" for ext in self.ALLOWED_EXTENSIONS_LIST)
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -0,0 +1,23 @@
+"""
+Keyset pagination cursors shared by list endpoints
+"""
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+from fastapi import HTTPException
+
+def encode_cursor(timestamp: datetime, row_id: uuid.UUID) -> str:
+    """Encode the (timestamp, id) of the last row on a page as an opaque cursor"""
+    raw = f"{timestamp.isoformat()},{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by encode_cursor, raising 400 if it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, row_id = raw.split(",", 1)
+        return datetime.fromisoformat(timestamp), uuid.UUID(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
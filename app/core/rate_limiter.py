@@ -2,57 +2,65 @@
 Rate limiting middleware for API endpoints
 """
 import time
-from collections import defaultdict
-from typing import Dict, Tuple
+from typing import Tuple
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
+import redis.asyncio as redis
 import logging
 
+from .config import settings
+
 logger = logging.getLogger(__name__)
 
 class RateLimiter:
-    """Simple in-memory rate limiter using sliding window"""
+    """Fixed-window rate limiter backed by a Redis counter shared across workers"""
+
+    INCREMENT_SCRIPT = """
+    local count = redis.call('INCR', KEYS[1])
+    if count == 1 then
+        redis.call('EXPIRE', KEYS[1], ARGV[1])
+    end
+    return count
+    """
 
-    def __init__(self, requests_per_minute: int = 100):
+    REDIS_TIMEOUT_SECONDS = 0.25
+    FAILURE_BACKOFF_SECONDS = 30
+
+    def __init__(self, requests_per_minute: int = 100, redis_url: str = settings.REDIS_URL):
         self.requests_per_minute = requests_per_minute
         self.window_seconds = 60
-        self.requests: Dict[str, list] = defaultdict(list)
-
-    def is_allowed(self, identifier: str) -> Tuple[bool, int]:
+        self.redis = redis.from_url(
+            redis_url,
+            socket_connect_timeout=self.REDIS_TIMEOUT_SECONDS,
+            socket_timeout=self.REDIS_TIMEOUT_SECONDS
+        )
+        self._increment = self.redis.register_script(self.INCREMENT_SCRIPT)
+        self._retry_at = 0.0
+
+    @property
+    def available(self) -> bool:
+        """False while backing off after a Redis failure"""
+        return time.monotonic() >= self._retry_at
+
+    def mark_unavailable(self):
+        """Stop calling Redis until the backoff period has passed"""
+        self._retry_at = time.monotonic() + self.FAILURE_BACKOFF_SECONDS
+
+    async def is_allowed(self, identifier: str) -> Tuple[bool, int, int]:
         """
         Check if request is allowed for the identifier (IP address)
 
         Returns:
-            Tuple of (is_allowed, remaining_requests)
+            Tuple of (is_allowed, remaining_requests, window_reset_timestamp)
         """
-        current_time = time.time()
-        window_start = current_time - self.window_seconds
-
-        request_times = self.requests[identifier]
-
-        request_times = [t for t in request_times if t > window_start]
-        self.requests[identifier] = request_times
-
-        if len(request_times) < self.requests_per_minute:
-            self.requests[identifier].append(current_time)
-            remaining = self.requests_per_minute - len(request_times) - 1
-            return True, remaining
-        else:
-            remaining = 0
-            return False, remaining
+        window = int(time.time() // self.window_seconds)
+        key = f"rl:{identifier}:{window}"
 
-    def cleanup_old_entries(self):
-        """Remove old entries to prevent memory leak"""
-        current_time = time.time()
-        window_start = current_time - self.window_seconds
+        count = await self._increment(keys=[key], args=[self.window_seconds])
 
-        to_remove = []
-        for ip, times in self.requests.items():
-            if not times or max(times) < window_start:
-                to_remove.append(ip)
-
-        for ip in to_remove:
-            del self.requests[ip]
+        remaining = max(self.requests_per_minute - count, 0)
+        reset_at = (window + 1) * self.window_seconds
+        return count <= self.requests_per_minute, remaining, reset_at
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Middleware to apply rate limiting to all requests"""
@@ -60,15 +68,25 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, requests_per_minute: int = 100):
         super().__init__(app)
         self.limiter = RateLimiter(requests_per_minute)
-        self.cleanup_counter = 0
 
     async def dispatch(self, request: Request, call_next):
         if request.url.path in ["/", "/health", "/api/v1/health", "/docs", "/redoc", "/openapi.json"]:
             return await call_next(request)
 
+        if not self.limiter.available:
+            return await call_next(request)
+
         client_ip = request.client.host if request.client else "unknown"
 
-        is_allowed, remaining = self.limiter.is_allowed(client_ip)
+        try:
+            is_allowed, remaining, reset_at = await self.limiter.is_allowed(client_ip)
+        except redis.RedisError as e:
+            self.limiter.mark_unavailable()
+            logger.warning(
+                f"Rate limiter unavailable, allowing requests for "
+                f"{self.limiter.FAILURE_BACKOFF_SECONDS}s: {e}"
+            )
+            return await call_next(request)
 
         if not is_allowed:
             logger.warning(f"Rate limit exceeded for IP: {client_ip}")
@@ -77,7 +95,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 detail={
                     "error": "Rate limit exceeded",
                     "message": f"Too many requests. Limit: {self.limiter.requests_per_minute} requests per minute",
-                    "retry_after": 60
+                    "retry_after": max(reset_at - int(time.time()), 1)
                 }
             )
 
@@ -85,12 +103,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         response.headers["X-RateLimit-Limit"] = str(self.limiter.requests_per_minute)
         response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + 60)
-
-        self.cleanup_counter += 1
-        if self.cleanup_counter >= 1000:
-            self.limiter.cleanup_old_entries()
-            self.cleanup_counter = 0
+        response.headers["X-RateLimit-Reset"] = str(reset_at)
 
         return response
 
@@ -102,4 +115,3 @@ def get_rate_limiter(requests_per_minute: int = 100) -> RateLimitMiddleware:
     if _rate_limiter is None:
         _rate_limiter = RateLimitMiddleware(None, requests_per_minute)
     return _rate_limiter
-
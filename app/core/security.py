@@ -1,15 +1,18 @@
+import hmac
+
 from fastapi import HTTPException, Security, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from .config import settings
 
 security = HTTPBearer()
 
+_AUTH_PASSWORD = settings.AUTH_PASSWORD.encode()
+
 def verify_password(credentials: HTTPAuthorizationCredentials = Security(security)) -> bool:
-    if credentials.credentials != settings.AUTH_PASSWORD:
+    if not hmac.compare_digest(credentials.credentials.encode(), _AUTH_PASSWORD):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
     return True
-
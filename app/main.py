@@ -1,18 +1,20 @@
 from fastapi import FastAPI
+from arq import create_pool
+from arq.connections import RedisSettings
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 import uvicorn
 import os
 import logging
 
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import engine
 from app.core.rate_limiter import RateLimitMiddleware
 from app.api.routes import health, resumes, errors, job_matching, quality_analysis, advanced_features
+from app.services.job_matcher.matcher_manager import get_job_matcher
 
 logger = logging.getLogger(__name__)
 
-Base.metadata.create_all(bind=engine)
-
 app = FastAPI(
     title="AI-Powered Resume Parser & Job Matcher",
     description="Complete resume analysis platform with AI-powered parsing, job matching, quality analysis, and advanced features",
@@ -21,25 +23,42 @@ app = FastAPI(
 
 @app.on_event("startup")
 async def startup_event():
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    get_job_matcher()
+
+    try:
+        app.state.arq_pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    except Exception as e:
+        app.state.arq_pool = None
+        logger.warning(f"Resume queue unavailable, processing uploads in-process: {e}")
+
     logger.info("=" * 70)
     logger.info("🚀 AI-Powered Resume Parser & Job Matcher v2.2.0")
     logger.info("=" * 70)
     logger.info("📊 Database: Connected")
     logger.info("🔌 API: Ready")
     logger.info("")
-    logger.info("ℹ️  ML Models will download on first use:")
-    logger.info("   • Flair NER (~500MB) - downloads when first resume is uploaded")
-    logger.info("   • This is normal and only happens once")
+    logger.info("ℹ️  Resume parsing runs in the arq worker:")
+    logger.info("   • Flair NER (~500MB) is loaded once there at worker startup")
+    logger.info("   • API processes only load it if the queue is unavailable")
     logger.info("")
     logger.info("📚 API Documentation: http://localhost:8000/docs")
     logger.info("=" * 70)
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    if getattr(app.state, "arq_pool", None) is not None:
+        await app.state.arq_pool.aclose()
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 rate_limit = int(os.getenv("RATE_LIMIT_PER_MINUTE", "100"))
@@ -1,10 +1,25 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Numeric
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Numeric, Index
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.expression import FunctionElement
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from datetime import datetime
 from app.core.database import Base
 import uuid
 
+class utc_now(FunctionElement):
+    """Current UTC time as a naive timestamp, matching the datetime.utcnow() values the app writes"""
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utc_now)
+def _utc_now_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utc_now, 'postgresql')
+def _utc_now_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
 class Resume(Base):
     __tablename__ = "resumes"
 
@@ -14,18 +29,22 @@ class Resume(Base):
     file_hash = Column(String(128), unique=True, nullable=False, index=True)
     file_size = Column(Integer, nullable=False)
     file_type = Column(String(50), nullable=False)
-    uploaded_at = Column(DateTime, default=datetime.utcnow)
+    uploaded_at = Column(DateTime, server_default=utc_now())
     processed_at = Column(DateTime, nullable=True)
     status = Column(String(50), default='pending', index=True)
     raw_text = Column(Text)
     structured_data = Column(JSONB)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     error_logs = relationship("ResumeParserErrorLog", back_populates="resume", cascade="all, delete-orphan")
     job_matches = relationship("ResumeJobMatch", back_populates="resume", cascade="all, delete-orphan")
     ai_analysis = relationship("AIAnalysis", back_populates="resume", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("idx_resumes_uploaded_at_id", uploaded_at.desc(), id.desc()),
+    )
+
 class ResumeJobMatch(Base):
     __tablename__ = "resume_job_matches"
 
@@ -45,15 +64,20 @@ class ResumeJobMatch(Base):
     competitive_advantages = Column(JSONB)
     explanation = Column(JSONB)
     processing_metadata = Column(JSONB)
-    matched_at = Column(DateTime, default=datetime.utcnow)
+    matched_at = Column(DateTime, server_default=utc_now())
 
     resume = relationship("Resume", back_populates="job_matches")
 
+    __table_args__ = (
+        Index("idx_resume_job_matches_resume_matched", resume_id, matched_at.desc(), id.desc()),
+        Index("idx_resume_job_matches_resume_score", resume_id, overall_score.desc()),
+    )
+
 class AIAnalysis(Base):
     __tablename__ = "ai_analysis"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
     quality_score = Column(Integer)
     completeness_score = Column(Integer)
     industry_classifications = Column(JSONB)
@@ -61,7 +85,7 @@ class AIAnalysis(Base):
     salary_estimate = Column(JSONB)
     suggestions = Column(JSONB)
     confidence_scores = Column(JSONB)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     resume = relationship("Resume", back_populates="ai_analysis")
 
@@ -78,8 +102,14 @@ class ResumeParserErrorLog(Base):
     context = Column(JSONB)
     severity = Column(String(20), default='error', index=True)
     is_resolved = Column(Boolean, default=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, server_default=utc_now(), index=True)
     resolved_at = Column(DateTime, nullable=True)
 
     resume = relationship("Resume", back_populates="error_logs")
 
+    __table_args__ = (
+        Index("idx_error_logs_severity_resolved_created", severity, is_resolved, created_at.desc()),
+        Index("idx_error_logs_created_at_id", created_at.desc(), id.desc()),
+        Index("idx_error_logs_resume_created", resume_id, created_at.desc()),
+    )
+
@@ -1,9 +1,10 @@
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 from datetime import datetime
+import uuid
 
 class JobMatchRequest(BaseModel):
-    resume_id: str
+    resume_id: uuid.UUID
     job_title: str
     job_description: str
     company_name: Optional[str] = None
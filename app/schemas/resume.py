@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, List, Optional
 from datetime import datetime
 
 class ResumeUploadResponse(BaseModel):
@@ -27,3 +27,7 @@ class ResumeStatusResponse(BaseModel):
     message: str
     processed_at: Optional[datetime] = None
 
+
+class JsonPatchOp(BaseModel):
+    path: List[str]
+    value: Any
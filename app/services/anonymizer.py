@@ -5,23 +5,77 @@ Removes personally identifiable information (PII) from resumes
 import logging
 import re
 import hashlib
-from typing import Dict, List, Any, Optional
+import threading
+import orjson
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Mapping, Optional, Tuple
 from datetime import datetime
-from copy import deepcopy
 
 logger = logging.getLogger(__name__)
 
 class ResumeAnonymizer:
     """Anonymizes resume data by removing or masking PII"""
 
+    NAME_PATTERNS = [
+        re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'),
+        re.compile(r'\b(?:Mr|Mrs|Ms|Dr|Prof)\.? [A-Z][a-z]+\b')
+    ]
+
+    GENDERED_PRONOUNS = {
+        'he': 'they',
+        'him': 'them',
+        'his': 'their',
+        'she': 'they',
+        'her': 'their',
+        'hers': 'theirs'
+    }
+
+    GENDERED_PATTERN = re.compile(r'\b(?:[Hh]e|[Hh]im|[Hh]is|[Ss]he|[Hh]er|[Hh]ers)\b')
+
+    YEAR_PATTERN = re.compile(r'(\d{4})')
+
+    COMPANY_TYPES = ('Technology', 'Financial', 'Healthcare', 'Retail', 'Education')
+
+    COMPANY_TYPE_PATTERN = re.compile(
+        r'(?=(?P<Technology>software|developer|engineer|tech)'
+        r'|(?P<Financial>finance|banking|investment)'
+        r'|(?P<Healthcare>healthcare|medical|hospital)'
+        r'|(?P<Retail>retail|sales|store)'
+        r'|(?P<Education>education|teaching|university))'
+    )
+
+    FIELD_SEPARATOR = '\x1e'
+
+    CACHE_SIZE = 256
+
+    EDUCATION_DATE_FIELDS = ('start_date', 'end_date', 'graduation_date')
+
+    WORK_DATE_FIELDS = ('start_date', 'end_date')
+
+    DEFAULT_OPTIONS = MappingProxyType({
+        'remove_name': True,
+        'remove_contact': True,
+        'remove_address': True,
+        'remove_photos': True,
+        'remove_age_dob': True,
+        'remove_gender': True,
+        'mask_education_dates': True,
+        'mask_work_dates': False,
+        'remove_company_names': False,
+        'remove_school_names': False
+    })
+
     def __init__(self):
         """Initialize anonymizer"""
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
         logger.info("Resume Anonymizer initialized")
 
     def anonymize_resume(
         self,
         resume_data: Dict[str, Any],
-        options: Optional[Dict[str, bool]] = None
+        options: Optional[Mapping[str, bool]] = None
     ) -> Dict[str, Any]:
         """
         Anonymize resume data by removing PII
@@ -48,192 +102,182 @@ class ResumeAnonymizer:
         if options is None:
             options = self._get_default_options()
 
-        anonymized_data = deepcopy(resume_data)
-
-        metadata = {
+        original_hash = self._generate_hash(resume_data)
+        # Only the known options affect the output, and only by truthiness, so
+        # key on those; arbitrary client values (lists, dicts) aren't hashable
+        cache_key = (original_hash, tuple(
+            bool(options.get(key, default)) for key, default in self.DEFAULT_OPTIONS.items()
+        ))
+
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+
+        if cached is None:
+            cached = self._anonymize(resume_data, options)
+            with self._cache_lock:
+                self._cache[cache_key] = cached
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        anonymized_data = self._structural_copy(cached)
+        anonymized_data['_anonymization_metadata'] = {
             'anonymized': True,
             'anonymization_date': datetime.utcnow().isoformat(),
-            'original_hash': self._generate_hash(resume_data),
-            'options_used': options
+            'original_hash': original_hash,
+            'options_used': dict(options)
         }
 
-        if options.get('remove_name', True):
-            anonymized_data = self._remove_name(anonymized_data)
+        logger.info("Resume anonymization completed")
+        return anonymized_data
 
-        if options.get('remove_contact', True):
-            anonymized_data = self._remove_contact_info(anonymized_data)
+    def _anonymize(self, resume_data: Dict[str, Any], options: Mapping[str, bool]) -> Dict[str, Any]:
+        """Apply the enabled anonymization steps to a copy of resume_data"""
+        anonymized_data = self._structural_copy(resume_data)
 
-        if options.get('remove_address', True):
-            anonymized_data = self._remove_address(anonymized_data)
+        personal_info = anonymized_data.get('personal_info')
+        contact = personal_info.get('contact') if personal_info is not None else None
+        experience = anonymized_data.get('experience') or []
+        education = anonymized_data.get('education') or []
 
-        if options.get('remove_age_dob', True):
-            anonymized_data = self._remove_age_dob(anonymized_data)
+        if options.get('remove_name', True) and personal_info is not None:
+            self._remove_name(personal_info)
 
-        if options.get('remove_gender', True):
-            anonymized_data = self._remove_gender(anonymized_data)
+        if options.get('remove_contact', True) and contact is not None:
+            self._remove_contact_info(contact)
 
-        if options.get('mask_education_dates', True):
-            anonymized_data = self._mask_education_dates(anonymized_data)
+        if options.get('remove_address', True) and contact is not None:
+            self._remove_address(contact)
 
-        if options.get('mask_work_dates', False):
-            anonymized_data = self._mask_work_dates(anonymized_data)
+        if options.get('remove_age_dob', True) and personal_info is not None:
+            self._remove_age_dob(personal_info)
 
-        if options.get('remove_company_names', False):
-            anonymized_data = self._anonymize_company_names(anonymized_data)
+        if options.get('remove_gender', True):
+            self._remove_gender(personal_info, experience)
 
-        if options.get('remove_school_names', False):
-            anonymized_data = self._anonymize_school_names(anonymized_data)
+        self._anonymize_education(
+            education,
+            options.get('mask_education_dates', True),
+            options.get('remove_school_names', False)
+        )
 
-        anonymized_data['_anonymization_metadata'] = metadata
+        self._anonymize_experience(
+            experience,
+            options.get('mask_work_dates', False),
+            options.get('remove_company_names', False)
+        )
 
-        logger.info("Resume anonymization completed")
         return anonymized_data
 
-    def _get_default_options(self) -> Dict[str, bool]:
+    def _structural_copy(self, obj: Any) -> Any:
+        """Copy nested dicts and lists so they can be mutated, sharing immutable leaf values"""
+        if isinstance(obj, dict):
+            return {key: self._structural_copy(value) for key, value in obj.items()}
+        if isinstance(obj, list):
+            return [self._structural_copy(item) for item in obj]
+        return obj
+
+    def _get_default_options(self) -> Mapping[str, bool]:
         """Get default anonymization options"""
-        return {
-            'remove_name': True,
-            'remove_contact': True,
-            'remove_address': True,
-            'remove_photos': True,
-            'remove_age_dob': True,
-            'remove_gender': True,
-            'mask_education_dates': True,
-            'mask_work_dates': False,
-            'remove_company_names': False,
-            'remove_school_names': False
-        }
+        return self.DEFAULT_OPTIONS
 
-    def _remove_name(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _remove_name(self, personal_info: Dict[str, Any]) -> None:
         """Remove name information"""
-        if 'personal_info' in data:
-            personal_info = data['personal_info']
-            candidate_id = self._generate_candidate_id(personal_info)
+        candidate_id = self._generate_candidate_id(personal_info)
 
-            personal_info['full_name'] = f"Candidate {candidate_id}"
-            personal_info['first_name'] = "Candidate"
-            personal_info['last_name'] = candidate_id
+        personal_info['full_name'] = f"Candidate {candidate_id}"
+        personal_info['first_name'] = "Candidate"
+        personal_info['last_name'] = candidate_id
 
-            if 'title' in personal_info:
-                personal_info['title'] = self._anonymize_text_names(personal_info['title'])
+        self._transform_fields(
+            [(personal_info, 'title'), (personal_info, 'summary')],
+            self._anonymize_text_names
+        )
 
-            if 'summary' in personal_info:
-                personal_info['summary'] = self._anonymize_text_names(personal_info['summary'])
-
-        return data
-
-    def _remove_contact_info(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _remove_contact_info(self, contact: Dict[str, Any]) -> None:
         """Remove contact information"""
-        if 'personal_info' in data and 'contact' in data['personal_info']:
-            contact = data['personal_info']['contact']
-
-            if 'email' in contact and contact['email']:
-                contact['email'] = self._anonymize_email(contact['email'])
+        if 'email' in contact and contact['email']:
+            contact['email'] = self._anonymize_email(contact['email'])
 
-            if 'phone' in contact:
-                contact['phone'] = ['[REDACTED]' for _ in contact.get('phone', [])]
+        if 'phone' in contact:
+            contact['phone'] = ['[REDACTED]' for _ in contact.get('phone', [])]
 
-            if 'linkedin' in contact:
-                contact['linkedin'] = '[REDACTED]' if contact.get('linkedin') else None
+        if 'linkedin' in contact:
+            contact['linkedin'] = '[REDACTED]' if contact.get('linkedin') else None
 
-            if 'github' in contact:
-                contact['github'] = '[REDACTED]' if contact.get('github') else None
+        if 'github' in contact:
+            contact['github'] = '[REDACTED]' if contact.get('github') else None
 
-            if 'website' in contact:
-                contact['website'] = '[REDACTED]' if contact.get('website') else None
+        if 'website' in contact:
+            contact['website'] = '[REDACTED]' if contact.get('website') else None
 
-            if 'urls' in contact:
-                contact['urls'] = ['[REDACTED]' for _ in contact.get('urls', [])]
+        if 'urls' in contact:
+            contact['urls'] = ['[REDACTED]' for _ in contact.get('urls', [])]
 
-        return data
-
-    def _remove_address(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _remove_address(self, contact: Dict[str, Any]) -> None:
         """Remove address information"""
-        if 'personal_info' in data and 'contact' in data['personal_info']:
-            contact = data['personal_info']['contact']
+        if 'address' in contact:
+            address = contact['address']
+            if isinstance(address, dict):
+                if 'city' in address:
+                    contact['address'] = {'city': address.get('city'), 'country': address.get('country')}
+            elif isinstance(address, str):
+                contact['address'] = self._extract_city_country(address)
+
+    def _remove_age_dob(self, personal_info: Dict[str, Any]) -> None:
+        """Remove age and date of birth"""
+        personal_info.pop('date_of_birth', None)
+        personal_info.pop('age', None)
 
-            if 'address' in contact:
-                address = contact['address']
-                if isinstance(address, dict):
-                    if 'city' in address:
-                        contact['address'] = {'city': address.get('city'), 'country': address.get('country')}
-                elif isinstance(address, str):
-                    contact['address'] = self._extract_city_country(address)
+    def _remove_gender(
+        self,
+        personal_info: Optional[Dict[str, Any]],
+        experience: List[Dict[str, Any]]
+    ) -> None:
+        """Remove gender information"""
+        fields = []
 
-        return data
+        if personal_info is not None:
+            personal_info.pop('gender', None)
+            fields.append((personal_info, 'summary'))
 
-    def _remove_age_dob(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Remove age and date of birth"""
-        if 'personal_info' in data:
-            personal_info = data['personal_info']
-            if 'date_of_birth' in personal_info:
-                del personal_info['date_of_birth']
-            if 'age' in personal_info:
-                del personal_info['age']
+        fields.extend((exp, 'description') for exp in experience)
 
-        return data
+        self._transform_fields(fields, self._neutralize_gendered_language)
 
-    def _remove_gender(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Remove gender information"""
-        if 'personal_info' in data:
-            personal_info = data['personal_info']
-            if 'gender' in personal_info:
-                del personal_info['gender']
-
-            if 'summary' in personal_info:
-                personal_info['summary'] = self._neutralize_gendered_language(
-                    personal_info['summary']
-                )
-
-        if 'experience' in data:
-            for exp in data['experience']:
-                if 'description' in exp:
-                    exp['description'] = self._neutralize_gendered_language(exp['description'])
-
-        return data
-
-    def _mask_education_dates(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Mask education dates to ranges"""
-        if 'education' in data:
-            for edu in data['education']:
-                if 'start_date' in edu:
-                    edu['start_date'] = self._mask_date_to_range(edu['start_date'])
-                if 'end_date' in edu:
-                    edu['end_date'] = self._mask_date_to_range(edu['end_date'])
-                if 'graduation_date' in edu:
-                    edu['graduation_date'] = self._mask_date_to_range(edu['graduation_date'])
-
-        return data
-
-    def _mask_work_dates(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Mask work experience dates to ranges"""
-        if 'experience' in data:
-            for exp in data['experience']:
-                if 'start_date' in exp:
-                    exp['start_date'] = self._mask_date_to_range(exp['start_date'])
-                if 'end_date' in exp:
-                    exp['end_date'] = self._mask_date_to_range(exp['end_date'])
-
-        return data
-
-    def _anonymize_company_names(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Anonymize company names"""
-        if 'experience' in data:
-            for i, exp in enumerate(data['experience']):
-                if 'company' in exp:
-                    company_type = self._infer_company_type(exp)
-                    exp['company'] = f"{company_type} Company {i + 1}"
-
-        return data
-
-    def _anonymize_school_names(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Anonymize school names"""
-        if 'education' in data:
-            for i, edu in enumerate(data['education']):
-                if 'institution' in edu:
-                    edu['institution'] = f"University {i + 1}"
-
-        return data
+    def _anonymize_experience(
+        self,
+        experience: List[Dict[str, Any]],
+        mask_dates: bool,
+        remove_company_names: bool
+    ) -> None:
+        """Mask work dates and anonymize company names in a single pass over experience"""
+        for i, exp in enumerate(experience):
+            if mask_dates:
+                self._mask_dates(exp, self.WORK_DATE_FIELDS)
+            if remove_company_names and 'company' in exp:
+                company_type = self._infer_company_type(exp)
+                exp['company'] = f"{company_type} Company {i + 1}"
+
+    def _anonymize_education(
+        self,
+        education: List[Dict[str, Any]],
+        mask_dates: bool,
+        remove_school_names: bool
+    ) -> None:
+        """Mask education dates and anonymize school names in a single pass over education"""
+        for i, edu in enumerate(education):
+            if mask_dates:
+                self._mask_dates(edu, self.EDUCATION_DATE_FIELDS)
+            if remove_school_names and 'institution' in edu:
+                edu['institution'] = f"University {i + 1}"
+
+    def _mask_dates(self, record: Dict[str, Any], fields: Tuple[str, ...]) -> None:
+        """Mask the given date fields of a record to year ranges"""
+        for field in fields:
+            if field in record:
+                record[field] = self._mask_date_to_range(record[field])
 
     def _generate_candidate_id(self, personal_info: Dict[str, Any]) -> str:
         """Generate anonymous candidate ID"""
@@ -243,27 +287,56 @@ class ResumeAnonymizer:
 
     def _generate_hash(self, data: Dict[str, Any]) -> str:
         """Generate hash of original data"""
-        data_str = str(data)
-        return hashlib.sha256(data_str.encode()).hexdigest()
+        data_bytes = orjson.dumps(
+            data,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+        return hashlib.sha256(data_bytes).hexdigest()
 
     def _anonymize_email(self, email: str) -> str:
-        """Anonymize email address"""
-        if '@' in email:
-            parts = email.split('@')
-            domain = parts[1]
-            return f"candidate@{domain}"
+        """Anonymize email address
+
+        Keeps the text between the first and second '@' as the domain, so
+        malformed input like 'a@b@c' maps to 'candidate@b'.
+        """
+        parts = email.split('@', 2)
+        if len(parts) > 1:
+            return f"candidate@{parts[1]}"
         return 'candidate@anonymized.com'
 
-    def _anonymize_text_names(self, text: str) -> str:
-        """Remove potential names from text"""
-        name_patterns = [
-            r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',
-            r'\b(?:Mr|Mrs|Ms|Dr|Prof)\.? [A-Z][a-z]+\b'
+    def _transform_fields(
+        self,
+        fields: List[Tuple[Dict[str, Any], str]],
+        transform: Callable[[str], str]
+    ) -> None:
+        """
+        Apply a text transform to several fields in a single call
+
+        The field values are joined with a record separator, transformed once and
+        split back into place. Fields that are missing or not text are skipped.
+        """
+        fields = [
+            (container, key) for container, key in fields
+            if isinstance(container.get(key), str) and container[key]
         ]
+        if not fields:
+            return
+
+        texts = [container[key] for container, key in fields]
+        if any(self.FIELD_SEPARATOR in text for text in texts):
+            results = [transform(text) for text in texts]
+        else:
+            results = transform(self.FIELD_SEPARATOR.join(texts)).split(self.FIELD_SEPARATOR)
 
+        for (container, key), result in zip(fields, results):
+            container[key] = result
+
+    def _anonymize_text_names(self, text: str) -> str:
+        """Remove potential names from text"""
         anonymized = text
-        for pattern in name_patterns:
-            anonymized = re.sub(pattern, '[NAME]', anonymized)
+        for pattern in self.NAME_PATTERNS:
+            anonymized = pattern.sub('[NAME]', anonymized)
 
         return anonymized
 
@@ -272,26 +345,13 @@ class ResumeAnonymizer:
         if not text:
             return text
 
-        replacements = {
-            r'\bhe\b': 'they',
-            r'\bhim\b': 'them',
-            r'\bhis\b': 'their',
-            r'\bshe\b': 'they',
-            r'\bher\b': 'their',
-            r'\bhers\b': 'theirs',
-            r'\bHe\b': 'They',
-            r'\bHim\b': 'Them',
-            r'\bHis\b': 'Their',
-            r'\bShe\b': 'They',
-            r'\bHer\b': 'Their',
-            r'\bHers\b': 'Theirs'
-        }
-
-        result = text
-        for pattern, replacement in replacements.items():
-            result = re.sub(pattern, replacement, result)
+        return self.GENDERED_PATTERN.sub(self._replace_pronoun, text)
 
-        return result
+    def _replace_pronoun(self, match: re.Match) -> str:
+        """Map a matched pronoun to its neutral form, keeping a leading capital"""
+        pronoun = match.group()
+        replacement = self.GENDERED_PRONOUNS[pronoun.lower()]
+        return replacement.capitalize() if pronoun[0].isupper() else replacement
 
     def _extract_city_country(self, address: str) -> Dict[str, Optional[str]]:
         """Extract only city and country from full address"""
@@ -302,14 +362,22 @@ class ResumeAnonymizer:
             return {'city': parts[0], 'country': None}
         return {'city': None, 'country': None}
 
+    def _find_year(self, date_str: str) -> Optional[int]:
+        """Find the first four-digit year, checking the common leading-year form before the regex"""
+        head = date_str[:4]
+        if len(head) == 4 and head.isdecimal():
+            return int(head)
+
+        year_match = self.YEAR_PATTERN.search(date_str)
+        return int(year_match.group(1)) if year_match else None
+
     def _mask_date_to_range(self, date_str: Optional[str]) -> Optional[str]:
         """Mask specific date to year range"""
         if not date_str or date_str == 'Present':
             return date_str
 
-        year_match = re.search(r'(\d{4})', str(date_str))
-        if year_match:
-            year = int(year_match.group(1))
+        year = self._find_year(str(date_str))
+        if year is not None:
             range_start = (year // 5) * 5
             range_end = range_start + 4
             return f"{range_start}-{range_end}"
@@ -321,18 +389,13 @@ class ResumeAnonymizer:
         title = (experience.get('title') or '').lower()
         description = (experience.get('description') or '').lower()
 
-        if any(word in title + description for word in ['software', 'developer', 'engineer', 'tech']):
-            return 'Technology'
-        elif any(word in title + description for word in ['finance', 'banking', 'investment']):
-            return 'Financial'
-        elif any(word in title + description for word in ['healthcare', 'medical', 'hospital']):
-            return 'Healthcare'
-        elif any(word in title + description for word in ['retail', 'sales', 'store']):
-            return 'Retail'
-        elif any(word in title + description for word in ['education', 'teaching', 'university']):
-            return 'Education'
-        else:
-            return 'Professional'
+        best_rank = len(self.COMPANY_TYPES)
+        for match in self.COMPANY_TYPE_PATTERN.finditer(title + description):
+            best_rank = min(best_rank, self.COMPANY_TYPES.index(match.lastgroup))
+            if best_rank == 0:
+                break
+
+        return self.COMPANY_TYPES[best_rank] if best_rank < len(self.COMPANY_TYPES) else 'Professional'
 
     def get_anonymization_report(
         self,
@@ -4,11 +4,20 @@ Detects potential biases in resume content and job descriptions
 """
 import logging
 import re
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
 class BiasDetector:
     """Detects potential biases in resume content and job descriptions"""
 
@@ -60,16 +69,55 @@ class BiasDetector:
         'good-looking', 'physical fitness', 'image', 'looks'
     ]
 
+    CATEGORY_WEIGHTS = {
+        'gender': 15,
+        'age': 12,
+        'cultural': 12,
+        'disability': 15,
+        'family_status': 10,
+        'appearance': 8,
+        'socioeconomic': 8
+    }
+
+    BIAS_DESCRIPTIONS = {
+        'gender': 'Gender-specific language that may discriminate based on gender',
+        'age': 'Age-related language that may discriminate based on age',
+        'cultural': 'Cultural or ethnic references that may create bias',
+        'disability': 'Language related to disabilities that may be discriminatory',
+        'family_status': 'References to family or marital status',
+        'appearance': 'Physical appearance requirements that may be discriminatory',
+        'socioeconomic': 'Socioeconomic indicators that may create bias'
+    }
+
+    BIAS_RECOMMENDATIONS = {
+        'gender': 'Use gender-neutral language (they/them) and avoid gender-specific terms',
+        'age': 'Focus on skills and experience rather than age-related descriptors',
+        'cultural': 'Use inclusive language that welcomes all cultural backgrounds',
+        'disability': 'Avoid disability-related language unless directly relevant to job requirements',
+        'family_status': 'Remove references to marital or family status',
+        'appearance': 'Focus on professional qualifications rather than physical appearance',
+        'socioeconomic': 'Avoid language that implies socioeconomic requirements'
+    }
+
+    INCLUSIVE_TERMS = [
+        'diverse', 'inclusive', 'equal opportunity', 'all backgrounds',
+        'everyone', 'anyone', 'people', 'individuals', 'team members',
+        'colleagues', 'professionals'
+    ]
+
     def __init__(self):
         """Initialize bias detector"""
         self.bias_patterns = self._compile_patterns()
+        self.combined_pattern, self._group_categories = self._compile_combined_pattern()
+        self.automaton = self._build_automaton() if AHOCORASICK_AVAILABLE else None
+        self.inclusive_pattern = re.compile('|'.join(
+            re.escape(term) for term in sorted(self.INCLUSIVE_TERMS, key=len, reverse=True)
+        ))
         logger.info("Bias Detector initialized")
 
-    def _compile_patterns(self) -> Dict[str, List[re.Pattern]]:
-        """Compile regex patterns for bias detection"""
-        patterns = {}
-
-        all_indicators = {
+    def _get_indicators(self) -> Dict[str, List[str]]:
+        """Get indicator phrases for each bias category"""
+        return {
             'gender': [word for words in self.GENDER_INDICATORS.values() for word in words],
             'age': [word for words in self.AGE_INDICATORS.values() for word in words],
             'cultural': [word for words in self.CULTURAL_INDICATORS.values() for word in words],
@@ -79,7 +127,11 @@ class BiasDetector:
             'appearance': self.APPEARANCE_INDICATORS
         }
 
-        for category, indicators in all_indicators.items():
+    def _compile_patterns(self) -> Dict[str, List[re.Pattern]]:
+        """Compile regex patterns for bias detection"""
+        patterns = {}
+
+        for category, indicators in self._get_indicators().items():
             patterns[category] = [
                 re.compile(r'\b' + re.escape(indicator) + r'\b', re.IGNORECASE)
                 for indicator in indicators
@@ -87,6 +139,86 @@ class BiasDetector:
 
         return patterns
 
+    def _compile_combined_pattern(self) -> Tuple[re.Pattern, Dict[str, List[Tuple[str, Optional[re.Pattern]]]]]:
+        """
+        Compile every indicator into a single alternation so text is scanned in one pass
+
+        The alternation sits in a lookahead, so a match is tried at every word
+        boundary and overlapping indicators (e.g. 'digital native' and 'native
+        speaker') are all found. Longer indicators are tried first; an indicator
+        that contains another one (e.g. 'professional appearance' and
+        'professional') also reports the shorter indicator's category.
+        """
+        indicators = [
+            (category, indicator, pattern)
+            for category, category_indicators in self._get_indicators().items()
+            for indicator, pattern in zip(category_indicators, self.bias_patterns[category])
+        ]
+        indicators.sort(key=lambda item: len(item[1]), reverse=True)
+
+        alternatives = []
+        group_categories = {}
+        for i, (category, indicator, _) in enumerate(indicators):
+            group = f'indicator_{i}'
+            alternatives.append(f'(?P<{group}>{re.escape(indicator)})')
+            group_categories[group] = [(category, None)] + [
+                (other_category, other_pattern)
+                for other_category, other_indicator, other_pattern in indicators
+                if other_indicator != indicator and other_pattern.search(indicator)
+            ]
+
+        combined = re.compile(r'\b(?=(?:' + '|'.join(alternatives) + r')\b)', re.IGNORECASE)
+        return combined, group_categories
+
+    def _build_automaton(self) -> 'ahocorasick.Automaton':
+        """Build an Aho-Corasick automaton over all lowercase indicators, tagged by category"""
+        word_categories = {}
+        for category, indicators in self._get_indicators().items():
+            for indicator in indicators:
+                word_categories.setdefault(indicator.lower(), []).append(category)
+
+        automaton = ahocorasick.Automaton()
+        for word, categories in word_categories.items():
+            automaton.add_word(word, (len(word), categories))
+        automaton.make_automaton()
+        return automaton
+
+    def scan(self, text: str) -> Dict[str, List[str]]:
+        """Find unique bias indicator matches in text, grouped by category"""
+        if self.automaton is not None:
+            text_lower = text.lower()
+            if len(text_lower) == len(text):
+                return self._scan_automaton(text, text_lower)
+
+        found = {category: set() for category in self.bias_patterns}
+
+        for match in self.combined_pattern.finditer(text):
+            matched_text = match.group(match.lastgroup)
+            for category, pattern in self._group_categories[match.lastgroup]:
+                if pattern is None:
+                    found[category].add(matched_text)
+                else:
+                    found[category].update(pattern.findall(matched_text))
+
+        return {category: list(matches) for category, matches in found.items() if matches}
+
+    def _scan_automaton(self, text: str, text_lower: str) -> Dict[str, List[str]]:
+        """Single linear pass over text with the automaton, keeping whole-word hits only"""
+        found = {category: set() for category in self.bias_patterns}
+
+        for end, (length, categories) in self.automaton.iter(text_lower):
+            start = end - length + 1
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if end + 1 < len(text_lower) and _is_word_char(text_lower[end + 1]):
+                continue
+
+            matched_text = text[start:end + 1]
+            for category in categories:
+                found[category].add(matched_text)
+
+        return {category: list(matches) for category, matches in found.items() if matches}
+
     def detect_bias_in_resume(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Detect potential biases in resume content
@@ -104,19 +236,17 @@ class BiasDetector:
         biases_found = []
         bias_score = 0
 
-        for category, patterns in self.bias_patterns.items():
-            matches = self._find_pattern_matches(text_content, patterns)
-            if matches:
-                bias_info = {
-                    'category': category,
-                    'severity': self._calculate_severity(category, len(matches)),
-                    'matches': matches,
-                    'count': len(matches),
-                    'description': self._get_bias_description(category),
-                    'recommendation': self._get_bias_recommendation(category)
-                }
-                biases_found.append(bias_info)
-                bias_score += len(matches) * self._get_category_weight(category)
+        for category, matches in self.scan(text_content).items():
+            bias_info = {
+                'category': category,
+                'severity': self._calculate_severity(category, len(matches)),
+                'matches': matches,
+                'count': len(matches),
+                'description': self.BIAS_DESCRIPTIONS[category],
+                'recommendation': self.BIAS_RECOMMENDATIONS[category]
+            }
+            biases_found.append(bias_info)
+            bias_score += len(matches) * self.CATEGORY_WEIGHTS[category]
 
         overall_risk = self._calculate_overall_risk(bias_score, biases_found)
 
@@ -126,7 +256,7 @@ class BiasDetector:
             'overall_risk': overall_risk,
             'biases_detected': biases_found,
             'total_bias_indicators': sum(b['count'] for b in biases_found),
-            'categories_affected': list(set(b['category'] for b in biases_found)),
+            'categories_affected': list(dict.fromkeys(b['category'] for b in biases_found)),
             'recommendations': self._generate_recommendations(biases_found),
             'analyzed_at': datetime.utcnow().isoformat()
         }
@@ -146,19 +276,17 @@ class BiasDetector:
         biases_found = []
         bias_score = 0
 
-        for category, patterns in self.bias_patterns.items():
-            matches = self._find_pattern_matches(job_description, patterns)
-            if matches:
-                bias_info = {
-                    'category': category,
-                    'severity': self._calculate_severity(category, len(matches)),
-                    'matches': matches,
-                    'count': len(matches),
-                    'description': self._get_bias_description(category),
-                    'recommendation': self._get_bias_recommendation(category)
-                }
-                biases_found.append(bias_info)
-                bias_score += len(matches) * self._get_category_weight(category)
+        for category, matches in self.scan(job_description).items():
+            bias_info = {
+                'category': category,
+                'severity': self._calculate_severity(category, len(matches)),
+                'matches': matches,
+                'count': len(matches),
+                'description': self.BIAS_DESCRIPTIONS[category],
+                'recommendation': self.BIAS_RECOMMENDATIONS[category]
+            }
+            biases_found.append(bias_info)
+            bias_score += len(matches) * self.CATEGORY_WEIGHTS[category]
 
         overall_risk = self._calculate_overall_risk(bias_score, biases_found)
 
@@ -170,7 +298,7 @@ class BiasDetector:
             'overall_risk': overall_risk,
             'biases_detected': biases_found,
             'total_bias_indicators': sum(b['count'] for b in biases_found),
-            'categories_affected': list(set(b['category'] for b in biases_found)),
+            'categories_affected': list(dict.fromkeys(b['category'] for b in biases_found)),
             'inclusive_language_score': inclusive_language_score,
             'recommendations': self._generate_recommendations(biases_found),
             'analyzed_at': datetime.utcnow().isoformat()
@@ -178,51 +306,33 @@ class BiasDetector:
 
     def _extract_text_from_resume(self, resume_data: Dict[str, Any]) -> str:
         """Extract all text content from resume data"""
-        text_parts = []
+        return ' '.join(str(part) for part in self._iter_resume_texts(resume_data) if part)
 
+    def _iter_resume_texts(self, resume_data: Dict[str, Any]) -> Iterator[Any]:
+        """Yield the text-bearing fields of a resume in document order"""
         if 'personal_info' in resume_data:
             personal_info = resume_data['personal_info']
-            if personal_info.get('full_name'):
-                text_parts.append(personal_info['full_name'])
-            if personal_info.get('summary'):
-                text_parts.append(personal_info['summary'])
-
-        if 'experience' in resume_data:
-            for exp in resume_data['experience']:
-                if exp.get('title'):
-                    text_parts.append(exp['title'])
-                if exp.get('company'):
-                    text_parts.append(exp['company'])
-                if exp.get('description'):
-                    text_parts.append(exp['description'])
-
-        if 'education' in resume_data:
-            for edu in resume_data['education']:
-                if edu.get('institution'):
-                    text_parts.append(edu['institution'])
-                if edu.get('degree'):
-                    text_parts.append(edu['degree'])
-                if edu.get('field'):
-                    text_parts.append(edu['field'])
+            yield personal_info.get('full_name')
+            yield personal_info.get('summary')
+
+        for exp in resume_data.get('experience', ()):
+            yield exp.get('title')
+            yield exp.get('company')
+            yield exp.get('description')
+
+        for edu in resume_data.get('education', ()):
+            yield edu.get('institution')
+            yield edu.get('degree')
+            yield edu.get('field')
 
         if 'skills' in resume_data:
             skills = resume_data['skills']
             if isinstance(skills, dict):
                 for skill_list in skills.values():
                     if isinstance(skill_list, list):
-                        text_parts.extend(skill_list)
+                        yield from skill_list
             elif isinstance(skills, list):
-                text_parts.extend(skills)
-
-        return ' '.join(str(part) for part in text_parts if part)
-
-    def _find_pattern_matches(self, text: str, patterns: List[re.Pattern]) -> List[str]:
-        """Find all pattern matches in text"""
-        matches = []
-        for pattern in patterns:
-            found = pattern.findall(text)
-            matches.extend(found)
-        return list(set(matches))
+                yield from skills
 
     def _calculate_severity(self, category: str, match_count: int) -> str:
         """Calculate severity level based on category and match count"""
@@ -243,19 +353,6 @@ class BiasDetector:
             else:
                 return 'low'
 
-    def _get_category_weight(self, category: str) -> int:
-        """Get weight for each bias category"""
-        weights = {
-            'gender': 15,
-            'age': 12,
-            'cultural': 12,
-            'disability': 15,
-            'family_status': 10,
-            'appearance': 8,
-            'socioeconomic': 8
-        }
-        return weights.get(category, 5)
-
     def _calculate_overall_risk(self, bias_score: int, biases_found: List[Dict]) -> str:
         """Calculate overall risk level"""
         high_severity_count = sum(1 for b in biases_found if b['severity'] == 'high')
@@ -269,32 +366,6 @@ class BiasDetector:
         else:
             return 'none'
 
-    def _get_bias_description(self, category: str) -> str:
-        """Get description for bias category"""
-        descriptions = {
-            'gender': 'Gender-specific language that may discriminate based on gender',
-            'age': 'Age-related language that may discriminate based on age',
-            'cultural': 'Cultural or ethnic references that may create bias',
-            'disability': 'Language related to disabilities that may be discriminatory',
-            'family_status': 'References to family or marital status',
-            'appearance': 'Physical appearance requirements that may be discriminatory',
-            'socioeconomic': 'Socioeconomic indicators that may create bias'
-        }
-        return descriptions.get(category, 'Potential bias detected')
-
-    def _get_bias_recommendation(self, category: str) -> str:
-        """Get recommendation for addressing bias"""
-        recommendations = {
-            'gender': 'Use gender-neutral language (they/them) and avoid gender-specific terms',
-            'age': 'Focus on skills and experience rather than age-related descriptors',
-            'cultural': 'Use inclusive language that welcomes all cultural backgrounds',
-            'disability': 'Avoid disability-related language unless directly relevant to job requirements',
-            'family_status': 'Remove references to marital or family status',
-            'appearance': 'Focus on professional qualifications rather than physical appearance',
-            'socioeconomic': 'Avoid language that implies socioeconomic requirements'
-        }
-        return recommendations.get(category, 'Review and remove biased language')
-
     def _generate_recommendations(self, biases_found: List[Dict]) -> List[str]:
         """Generate overall recommendations for addressing biases"""
         if not biases_found:
@@ -315,20 +386,8 @@ class BiasDetector:
 
     def _check_inclusive_language(self, text: str) -> int:
         """Check for inclusive language usage (0-100 score)"""
-        inclusive_terms = [
-            'diverse', 'inclusive', 'equal opportunity', 'all backgrounds',
-            'everyone', 'anyone', 'people', 'individuals', 'team members',
-            'colleagues', 'professionals'
-        ]
-
-        score = 0
-        text_lower = text.lower()
-
-        for term in inclusive_terms:
-            if term in text_lower:
-                score += 15
-
-        return min(score, 100)
+        found_terms = set(self.inclusive_pattern.findall(text.lower()))
+        return min(len(found_terms) * 15, 100)
 
 _bias_detector_instance = None
 
@@ -2,13 +2,64 @@
 Candidate Ranking System
 Ranks multiple candidates for a job position using multi-criteria analysis
 """
+import copy
+import hashlib
+import heapq
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import re
+import threading
+from collections import OrderedDict
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from datetime import datetime
-import statistics
+
+import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available, using NumPy score aggregation")
+
+CATEGORY_ORDER = (
+    'skills_match',
+    'experience_match',
+    'education_match',
+    'cultural_fit',
+    'career_trajectory',
+    'certifications',
+    'availability'
+)
+_category_values = itemgetter(*CATEGORY_ORDER)
+CATEGORY_LABELS = {category: category.replace('_', ' ').title() for category in CATEGORY_ORDER}
+
+TIER_LABELS = ('D', 'C', 'B', 'A', 'S')
+TIER_THRESHOLDS = np.array([45, 60, 75, 90], dtype=np.float64)
+
+if NUMBA_AVAILABLE:
+    # Compiled on first ranking call, not at import; cache=True lets later
+    # processes load the compiled kernel from disk instead
+    @njit(cache=True, parallel=True)
+    def _aggregate_scores(sub_scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Weighted sum of category scores, one row per candidate"""
+        n_candidates, n_criteria = sub_scores.shape
+        final_scores = np.zeros(n_candidates)
+        for i in prange(n_candidates):
+            total = 0.0
+            for k in range(n_criteria):
+                total += sub_scores[i, k] * weights[k]
+            final_scores[i] = total
+        return final_scores
+else:
+    def _aggregate_scores(sub_scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Weighted sum of category scores, one row per candidate"""
+        return sub_scores @ weights
+
 class CandidateRanker:
     """Ranks candidates for job positions using multi-criteria analysis"""
 
@@ -22,8 +73,44 @@ class CandidateRanker:
         'availability': 0.05
     }
 
+    CACHE_SIZE = 128
+    SCORE_CACHE_SIZE = 4096
+
+    EDUCATION_LEVELS = {
+        'high school': 1,
+        'associate': 2,
+        'bachelor': 3,
+        'master': 4,
+        'mba': 4,
+        'phd': 5,
+        'doctorate': 5
+    }
+    EDUCATION_LEVEL_PATTERN = re.compile('(?=(' + '|'.join(EDUCATION_LEVELS) + '))')
+
+    DESIRED_SOFT_SKILLS = ('communication', 'teamwork', 'leadership', 'problem solving', 'adaptability')
+    DESIRED_SOFT_SKILLS_PATTERN = re.compile('|'.join(DESIRED_SOFT_SKILLS))
+
+    TEAM_KEYWORDS = ('team', 'collaborate', 'led', 'managed')
+    TEAM_EXPERIENCE_PATTERN = re.compile('|'.join(TEAM_KEYWORDS))
+
+    PROMOTION_INDICATORS = ('senior', 'lead', 'principal', 'manager', 'director', 'head', 'vp', 'chief')
+
+    AVAILABILITY_SCORES = {
+        'immediate': 100,
+        'within_2_weeks': 90,
+        'within_1_month': 80,
+        'within_2_months': 60,
+        'within_3_months': 40,
+        'unknown': 50
+    }
+
+    __slots__ = ('_cache', '_cache_lock', '_score_cache')
+
     def __init__(self):
         """Initialize candidate ranker"""
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._score_cache: OrderedDict = OrderedDict()
         logger.info("Candidate Ranker initialized")
 
     def rank_candidates(
@@ -48,24 +135,79 @@ class CandidateRanker:
         if weights is None:
             weights = self.DEFAULT_WEIGHTS
 
-        ranked_candidates = []
-        for candidate in candidates:
-            ranking_data = self._calculate_candidate_ranking(
-                candidate,
-                job_requirements,
-                weights
-            )
-            ranked_candidates.append(ranking_data)
+        cache_key = self._hash([candidates, job_requirements, weights])
 
-        ranked_candidates.sort(key=lambda x: x['final_score'], reverse=True)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+
+        if cached is not None:
+            # Earlier callers may hold this result, so hand out a private copy
+            result = copy.deepcopy(cached)
+        else:
+            cached = self._rank(candidates, job_requirements, weights)
+            with self._cache_lock:
+                self._cache[cache_key] = cached
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            # Freshly built, so only the top level is copied to keep ranked_at out of the cache
+            result = dict(cached)
+
+        result['ranked_at'] = datetime.utcnow().isoformat()
+        return result
+
+    def _rank(
+        self,
+        candidates: List[Dict[str, Any]],
+        job_requirements: Dict[str, Any],
+        weights: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Score, order and summarize candidates"""
+        required_skills_lower = frozenset(
+            s.lower() for s in job_requirements.get('required_skills', [])
+        )
+        required_education = job_requirements.get('education_required', '')
+        required_education_level = (
+            self._education_level(required_education.lower()) if required_education else None
+        )
+
+        job_key = self._hash(job_requirements)
+        category_scores = [
+            self._cached_category_scores(
+                candidate, job_requirements, job_key, required_skills_lower, required_education_level
+            )
+            for candidate in candidates
+        ]
+
+        sub_scores = np.array(
+            list(map(_category_values, category_scores)),
+            dtype=np.float64
+        ).reshape(len(candidates), len(CATEGORY_ORDER))
+        weight_vector = np.array([weights.get(key, 0) for key in CATEGORY_ORDER], dtype=np.float64)
+        final_scores = _aggregate_scores(sub_scores, weight_vector)
+
+        scored_candidates = [
+            self._build_candidate_ranking(candidate, scores, float(final_score), weights)
+            for candidate, scores, final_score in zip(candidates, category_scores, final_scores)
+        ]
+
+        rounded_scores = np.fromiter(
+            (ranking['final_score'] for ranking in scored_candidates),
+            dtype=np.float64,
+            count=len(scored_candidates)
+        )
+        order = np.argsort(-rounded_scores, kind='stable')
+        ranked_candidates = [scored_candidates[i] for i in order.tolist()]
+        ranked_scores = rounded_scores[order]
 
         for i, candidate in enumerate(ranked_candidates):
             candidate['rank'] = i + 1
             candidate['percentile'] = ((len(ranked_candidates) - i) / len(ranked_candidates) * 100)
 
-        tiers = self._assign_tiers(ranked_candidates)
+        tiers = self._assign_tiers(ranked_candidates, ranked_scores)
 
-        statistics_data = self._calculate_statistics(ranked_candidates)
+        statistics_data = self._calculate_statistics(ranked_candidates, ranked_scores)
 
         return {
             'total_candidates': len(ranked_candidates),
@@ -73,31 +215,78 @@ class CandidateRanker:
             'tier_distribution': tiers,
             'statistics': statistics_data,
             'weights_used': weights,
-            'ranking_criteria': list(weights.keys()),
-            'ranked_at': datetime.utcnow().isoformat()
+            'ranking_criteria': list(weights.keys())
         }
 
-    def _calculate_candidate_ranking(
+    def _hash(self, data: Any) -> bytes:
+        """Stable digest of JSON-like data for cache keys"""
+        return hashlib.blake2b(orjson.dumps(
+            data,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )).digest()
+
+    def _cached_category_scores(
         self,
         candidate: Dict[str, Any],
         job_requirements: Dict[str, Any],
-        weights: Dict[str, float]
-    ) -> Dict[str, Any]:
-        """Calculate comprehensive ranking score for a candidate"""
+        job_key: bytes,
+        required_skills_lower: Optional[FrozenSet[str]] = None,
+        required_education_level: Optional[int] = None
+    ) -> Dict[str, float]:
+        """Category scores for a candidate, reused across overlapping candidate pools"""
+        cache_key = (job_key, self._hash(candidate))
+
+        with self._cache_lock:
+            scores = self._score_cache.get(cache_key)
+            if scores is not None:
+                self._score_cache.move_to_end(cache_key)
+                return scores
+
+        scores = self._score_categories(
+            candidate, job_requirements, required_skills_lower, required_education_level
+        )
+        with self._cache_lock:
+            self._score_cache[cache_key] = scores
+            if len(self._score_cache) > self.SCORE_CACHE_SIZE:
+                self._score_cache.popitem(last=False)
+        return scores
+
+    def _score_categories(
+        self,
+        candidate: Dict[str, Any],
+        job_requirements: Dict[str, Any],
+        required_skills_lower: Optional[FrozenSet[str]] = None,
+        required_education_level: Optional[int] = None
+    ) -> Dict[str, float]:
+        """Score a candidate on every ranking category"""
         resume_data = candidate.get('resume_data', {})
         match_data = candidate.get('match_data', {})
 
-        scores = {
-            'skills_match': self._score_skills_match(resume_data, job_requirements, match_data),
+        return {
+            'skills_match': self._score_skills_match(
+                resume_data, job_requirements, match_data, required_skills_lower
+            ),
             'experience_match': self._score_experience_match(resume_data, job_requirements),
-            'education_match': self._score_education_match(resume_data, job_requirements),
+            'education_match': self._score_education_match(
+                resume_data, job_requirements, required_education_level
+            ),
             'cultural_fit': self._score_cultural_fit(resume_data, job_requirements),
             'career_trajectory': self._score_career_trajectory(resume_data),
             'certifications': self._score_certifications(resume_data),
             'availability': self._score_availability(candidate)
         }
 
-        final_score = sum(scores[key] * weights.get(key, 0) for key in scores.keys())
+    def _build_candidate_ranking(
+        self,
+        candidate: Dict[str, Any],
+        scores: Dict[str, float],
+        final_score: float,
+        weights: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Build the ranking entry for a candidate from its aggregated score"""
+        resume_data = candidate.get('resume_data', {})
+        match_data = candidate.get('match_data', {})
 
         strengths, weaknesses = self._identify_candidate_strengths_weaknesses(scores, weights)
 
@@ -109,7 +298,7 @@ class CandidateRanker:
             'strengths': strengths,
             'weaknesses': weaknesses,
             'recommendation': self._generate_recommendation(final_score, strengths, weaknesses),
-            'interview_priority': self._determine_interview_priority(final_score, scores),
+            'interview_priority': self._determine_interview_priority(final_score, scores['skills_match']),
             'match_summary': match_data.get('overall_score', 0)
         }
 
@@ -117,7 +306,8 @@ class CandidateRanker:
         self,
         resume_data: Dict[str, Any],
         job_requirements: Dict[str, Any],
-        match_data: Dict[str, Any]
+        match_data: Dict[str, Any],
+        required_skills_lower: Optional[FrozenSet[str]] = None
     ) -> float:
         """Score skills match (0-100)"""
         skill_analysis = match_data.get('skill_analysis', {})
@@ -133,16 +323,18 @@ class CandidateRanker:
         if not required_skills:
             return 50
 
-        all_candidate_skills = []
         if isinstance(candidate_skills, dict):
-            for skill_list in candidate_skills.values():
-                if isinstance(skill_list, list):
-                    all_candidate_skills.extend([s.lower() for s in skill_list])
+            all_candidate_skills = chain.from_iterable(
+                skill_list for skill_list in candidate_skills.values() if isinstance(skill_list, list)
+            )
         elif isinstance(candidate_skills, list):
-            all_candidate_skills = [s.lower() for s in candidate_skills]
+            all_candidate_skills = candidate_skills
+        else:
+            all_candidate_skills = ()
 
-        required_skills_lower = [s.lower() for s in required_skills]
-        matches = len([s for s in all_candidate_skills if s in required_skills_lower])
+        if required_skills_lower is None:
+            required_skills_lower = frozenset(s.lower() for s in required_skills)
+        matches = sum(1 for s in all_candidate_skills if s.lower() in required_skills_lower)
 
         return (matches / len(required_skills) * 100) if required_skills else 50
 
@@ -175,7 +367,8 @@ class CandidateRanker:
     def _score_education_match(
         self,
         resume_data: Dict[str, Any],
-        job_requirements: Dict[str, Any]
+        job_requirements: Dict[str, Any],
+        required_level: Optional[int] = None
     ) -> float:
         """Score education match (0-100)"""
         education = resume_data.get('education', [])
@@ -184,27 +377,13 @@ class CandidateRanker:
         if not required_education:
             return 75
 
-        education_levels = {
-            'high school': 1,
-            'associate': 2,
-            'bachelor': 3,
-            'master': 4,
-            'mba': 4,
-            'phd': 5,
-            'doctorate': 5
-        }
-
-        required_level = 0
-        for level, value in education_levels.items():
-            if level in required_education.lower():
-                required_level = max(required_level, value)
+        if required_level is None:
+            required_level = self._education_level(required_education.lower())
 
-        candidate_level = 0
-        for edu in education:
-            degree = (edu.get('degree', '') or '').lower()
-            for level, value in education_levels.items():
-                if level in degree:
-                    candidate_level = max(candidate_level, value)
+        candidate_level = max(
+            (self._education_level((edu.get('degree', '') or '').lower()) for edu in education),
+            default=0
+        )
 
         if candidate_level >= required_level:
             return 100
@@ -215,6 +394,13 @@ class CandidateRanker:
         else:
             return 20
 
+    def _education_level(self, text: str) -> int:
+        """Highest education level named in lowercased text, 0 if none"""
+        return max(
+            (self.EDUCATION_LEVELS[level] for level in self.EDUCATION_LEVEL_PATTERN.findall(text)),
+            default=0
+        )
+
     def _score_cultural_fit(
         self,
         resume_data: Dict[str, Any],
@@ -227,20 +413,17 @@ class CandidateRanker:
         if isinstance(candidate_skills, dict):
             soft_skills = [s.lower() for s in candidate_skills.get('soft', [])]
 
-        desired_soft_skills = ['communication', 'teamwork', 'leadership', 'problem solving', 'adaptability']
-
         if not soft_skills:
             return 50
 
-        match_count = len([s for s in soft_skills if any(ds in s for ds in desired_soft_skills)])
+        match_count = sum(1 for s in soft_skills if self.DESIRED_SOFT_SKILLS_PATTERN.search(s))
 
-        base_score = (match_count / len(desired_soft_skills) * 100)
+        base_score = (match_count / len(self.DESIRED_SOFT_SKILLS) * 100)
 
         experience = resume_data.get('experience', [])
         team_experience = sum(
             1 for exp in experience
-            if any(word in (exp.get('description', '') or '').lower()
-                   for word in ['team', 'collaborate', 'led', 'managed'])
+            if self.TEAM_EXPERIENCE_PATTERN.search((exp.get('description', '') or '').lower())
         )
 
         bonus = min(team_experience * 10, 20)
@@ -256,7 +439,7 @@ class CandidateRanker:
 
         sorted_exp = sorted(
             [exp for exp in experience if exp.get('start_date')],
-            key=lambda x: x.get('start_date', ''),
+            key=itemgetter('start_date'),
             reverse=True
         )
 
@@ -264,11 +447,9 @@ class CandidateRanker:
 
         titles = [exp.get('title', '').lower() for exp in sorted_exp]
 
-        promotion_indicators = ['senior', 'lead', 'principal', 'manager', 'director', 'head', 'vp', 'chief']
-
         seniority_levels = []
         for title in titles:
-            level = sum(1 for indicator in promotion_indicators if indicator in title)
+            level = sum(1 for indicator in self.PROMOTION_INDICATORS if indicator in title)
             seniority_levels.append(level)
 
         if len(seniority_levels) >= 2:
@@ -313,16 +494,7 @@ class CandidateRanker:
         """Score candidate availability (0-100)"""
         availability = candidate.get('availability', 'unknown')
 
-        availability_scores = {
-            'immediate': 100,
-            'within_2_weeks': 90,
-            'within_1_month': 80,
-            'within_2_months': 60,
-            'within_3_months': 40,
-            'unknown': 50
-        }
-
-        return availability_scores.get(availability.lower(), 50)
+        return self.AVAILABILITY_SCORES.get(availability.lower(), 50)
 
     def _get_candidate_name(self, resume_data: Dict[str, Any]) -> str:
         """Get candidate name from resume data"""
@@ -338,15 +510,17 @@ class CandidateRanker:
         strengths = []
         weaknesses = []
 
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        items = list(scores.items())
+        top_scores = heapq.nlargest(3, items, key=itemgetter(1))
+        bottom_scores = heapq.nsmallest(3, reversed(items), key=itemgetter(1))[::-1]
 
-        for category, score in sorted_scores[:3]:
+        for category, score in top_scores:
             if score >= 75:
-                strengths.append(f"{category.replace('_', ' ').title()}: {score:.0f}%")
+                strengths.append(f"{CATEGORY_LABELS[category]}: {score:.0f}%")
 
-        for category, score in sorted_scores[-3:]:
+        for category, score in bottom_scores:
             if score < 60 and weights.get(category, 0) >= 0.10:
-                weaknesses.append(f"{category.replace('_', ' ').title()}: {score:.0f}%")
+                weaknesses.append(f"{CATEGORY_LABELS[category]}: {score:.0f}%")
 
         if not strengths:
             strengths = ["Balanced skill set"]
@@ -377,12 +551,9 @@ class CandidateRanker:
     def _determine_interview_priority(
         self,
         final_score: float,
-        scores: Dict[str, float]
+        skills_score: float
     ) -> str:
         """Determine interview priority"""
-        skills_score = scores.get('skills_match', 0)
-        experience_score = scores.get('experience_match', 0)
-
         if final_score >= 85 and skills_score >= 80:
             return "urgent"
         elif final_score >= 70:
@@ -392,47 +563,54 @@ class CandidateRanker:
         else:
             return "low"
 
-    def _assign_tiers(self, ranked_candidates: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _assign_tiers(
+        self,
+        ranked_candidates: List[Dict[str, Any]],
+        final_scores: Optional[np.ndarray] = None
+    ) -> Dict[str, int]:
         """Assign candidates to tiers"""
-        tiers = {'S_tier': 0, 'A_tier': 0, 'B_tier': 0, 'C_tier': 0, 'D_tier': 0}
-
-        for candidate in ranked_candidates:
-            score = candidate['final_score']
-            if score >= 90:
-                candidate['tier'] = 'S'
-                tiers['S_tier'] += 1
-            elif score >= 75:
-                candidate['tier'] = 'A'
-                tiers['A_tier'] += 1
-            elif score >= 60:
-                candidate['tier'] = 'B'
-                tiers['B_tier'] += 1
-            elif score >= 45:
-                candidate['tier'] = 'C'
-                tiers['C_tier'] += 1
-            else:
-                candidate['tier'] = 'D'
-                tiers['D_tier'] += 1
-
-        return tiers
-
-    def _calculate_statistics(self, ranked_candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate ranking statistics"""
-        scores = [c['final_score'] for c in ranked_candidates]
+        if final_scores is None:
+            final_scores = np.fromiter(
+                (candidate['final_score'] for candidate in ranked_candidates),
+                dtype=np.float64,
+                count=len(ranked_candidates)
+            )
+        buckets = np.searchsorted(TIER_THRESHOLDS, final_scores, side='right')
+
+        for candidate, bucket in zip(ranked_candidates, buckets.tolist()):
+            candidate['tier'] = TIER_LABELS[bucket]
 
-        if not scores:
+        counts = np.bincount(buckets, minlength=len(TIER_LABELS)).tolist()
+        return {f'{label}_tier': counts[i] for i, label in reversed(list(enumerate(TIER_LABELS)))}
+
+    def _calculate_statistics(
+        self,
+        ranked_candidates: List[Dict[str, Any]],
+        scores: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
+        """Calculate ranking statistics"""
+        if not ranked_candidates:
             return {}
 
+        if scores is None:
+            scores = np.fromiter(
+                (c['final_score'] for c in ranked_candidates),
+                dtype=np.float64,
+                count=len(ranked_candidates)
+            )
+        min_score = float(scores.min())
+        max_score = float(scores.max())
+
         return {
-            'mean_score': round(statistics.mean(scores), 2),
-            'median_score': round(statistics.median(scores), 2),
-            'std_deviation': round(statistics.stdev(scores), 2) if len(scores) > 1 else 0,
-            'min_score': round(min(scores), 2),
-            'max_score': round(max(scores), 2),
-            'score_range': round(max(scores) - min(scores), 2),
-            'top_10_percent_cutoff': round(statistics.quantiles(scores, n=10)[-1], 2) if len(scores) >= 10 else max(scores),
-            'qualified_candidates': len([s for s in scores if s >= 60]),
-            'highly_qualified_candidates': len([s for s in scores if s >= 75])
+            'mean_score': round(float(scores.mean()), 2),
+            'median_score': round(float(np.median(scores)), 2),
+            'std_deviation': round(float(scores.std(ddof=1)), 2) if len(scores) > 1 else 0,
+            'min_score': round(min_score, 2),
+            'max_score': round(max_score, 2),
+            'score_range': round(max_score - min_score, 2),
+            'top_10_percent_cutoff': round(float(np.percentile(scores, 90, method='weibull')), 2) if len(scores) >= 10 else max_score,
+            'qualified_candidates': int(np.count_nonzero(scores >= 60)),
+            'highly_qualified_candidates': int(np.count_nonzero(scores >= 75))
         }
 
     def compare_candidates(
@@ -514,28 +692,22 @@ class CandidateRanker:
 
     def _compare_resume_structures(self, structured1: Dict[str, Any], structured2: Dict[str, Any]) -> Dict[str, Any]:
         """Compare resume structures"""
-        return {
-            'skills': {
-                'candidate1_count': len(structured1.get('skills', [])),
-                'candidate2_count': len(structured2.get('skills', [])),
-                'leader': 'candidate1' if len(structured1.get('skills', [])) > len(structured2.get('skills', [])) else 'candidate2'
-            },
-            'experience': {
-                'candidate1_count': len(structured1.get('work_experience', [])),
-                'candidate2_count': len(structured2.get('work_experience', [])),
-                'leader': 'candidate1' if len(structured1.get('work_experience', [])) > len(structured2.get('work_experience', [])) else 'candidate2'
-            },
-            'education': {
-                'candidate1_count': len(structured1.get('education', [])),
-                'candidate2_count': len(structured2.get('education', [])),
-                'leader': 'candidate1' if len(structured1.get('education', [])) > len(structured2.get('education', [])) else 'candidate2'
-            },
-            'certifications': {
-                'candidate1_count': len(structured1.get('certifications', [])),
-                'candidate2_count': len(structured2.get('certifications', [])),
-                'leader': 'candidate1' if len(structured1.get('certifications', [])) > len(structured2.get('certifications', [])) else 'candidate2'
+        comparison = {}
+        for section, key in (
+            ('skills', 'skills'),
+            ('experience', 'work_experience'),
+            ('education', 'education'),
+            ('certifications', 'certifications')
+        ):
+            count1 = len(structured1.get(key) or [])
+            count2 = len(structured2.get(key) or [])
+            comparison[section] = {
+                'candidate1_count': count1,
+                'candidate2_count': count2,
+                'leader': 'candidate1' if count1 > count2 else 'candidate2'
             }
-        }
+
+        return comparison
 
 _candidate_ranker_instance = None
 
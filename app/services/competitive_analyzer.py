@@ -2,13 +2,48 @@
 Competitive Analysis for Job Matching
 Analyzes candidate competitiveness against market standards and other candidates
 """
+import bisect
 import logging
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-import statistics
+from types import MappingProxyType
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+COMPETITIVENESS_LEVELS = (
+    ('below_average', 40),
+    ('moderately_competitive', 60),
+    ('competitive', 80),
+    ('highly_competitive', 95)
+)
+
+MARKET_POSITION_THRESHOLDS = (55, 70, 85)
+MARKET_POSITIONS = (
+    ('below_average', 'Below average - Needs improvement'),
+    ('average', 'Top 50% - Average competitive position'),
+    ('strong', 'Top 25% - Strong competitive position'),
+    ('top_tier', 'Top 10% - Highly competitive candidate')
+)
+
+PERCENTILE_THRESHOLDS = (35, 45, 55, 65, 75, 85, 95)
+PERCENTILES = (10, 25, 40, 50, 60, 75, 90, 99)
+
+def _competitiveness_bucket(value: float, thresholds: Tuple[float, float, float]) -> Tuple[str, int]:
+    """Map a value to its (level, score) given ascending moderate/competitive/highly thresholds"""
+    return COMPETITIVENESS_LEVELS[bisect.bisect_right(thresholds, value)]
+
+def _freeze_benchmark(benchmark: Dict[str, Any]) -> MappingProxyType:
+    """Read-only benchmark with its skill set and salary text precomputed"""
+    low, high = benchmark['avg_salary_range']
+    return MappingProxyType({
+        **benchmark,
+        'common_skills_set': frozenset(s.lower() for s in benchmark['common_skills']),
+        'salary_range_text': f"${low:,} - ${high:,}"
+    })
+
 class CompetitiveAnalyzer:
     """Analyzes candidate competitiveness in the job market"""
 
@@ -44,6 +79,29 @@ class CompetitiveAnalyzer:
             'avg_salary_range': (60000, 120000)
         }
     }
+    INDUSTRY_BENCHMARKS = MappingProxyType({
+        industry: _freeze_benchmark(benchmark) for industry, benchmark in INDUSTRY_BENCHMARKS.items()
+    })
+
+    INDUSTRY_KEYWORDS = {
+        'software_engineering': ('software', 'developer', 'engineer', 'programming'),
+        'data_science': ('data science', 'machine learning', 'ai', 'analytics'),
+        'product_management': ('product manager', 'product owner', 'pm'),
+        'devops': ('devops', 'sre', 'infrastructure', 'cloud engineer')
+    }
+
+    EDUCATION_LEVELS = {
+        'high school': 1,
+        'associate': 2,
+        'bachelor': 3,
+        'master': 4,
+        'mba': 4,
+        'phd': 5,
+        'doctorate': 5
+    }
+    EDUCATION_LEVEL_PATTERN = re.compile('(?=(' + '|'.join(EDUCATION_LEVELS) + '))')
+
+    LEADERSHIP_TITLE_PATTERN = re.compile(r'\b(?:lead(?:er|ership|ing)?|manager|director|head|chief)\b', re.IGNORECASE)
 
     def __init__(self):
         """Initialize competitive analyzer"""
@@ -54,7 +112,8 @@ class CompetitiveAnalyzer:
         resume_data: Dict[str, Any],
         job_requirements: Dict[str, Any],
         match_score: float,
-        other_candidates: Optional[List[Dict[str, Any]]] = None
+        other_candidates: Optional[List[Dict[str, Any]]] = None,
+        analyzed_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Analyze candidate competitiveness
@@ -64,6 +123,7 @@ class CompetitiveAnalyzer:
             job_requirements: Job requirements
             match_score: Overall match score (0-100)
             other_candidates: Optional list of other candidate data for comparison
+            analyzed_at: Optional ISO timestamp to share across a batch of analyses
 
         Returns:
             Competitive analysis results
@@ -130,27 +190,22 @@ class CompetitiveAnalyzer:
             'market_insights': self._generate_market_insights(
                 market_position, industry, benchmarks
             ),
-            'analyzed_at': datetime.utcnow().isoformat()
+            'analyzed_at': analyzed_at or datetime.utcnow().isoformat()
         }
 
     def _infer_industry(self, job_requirements: Dict[str, Any]) -> str:
         """Infer industry from job requirements"""
-        title = (job_requirements.get('job_title', '') or '').lower()
-        description = (job_requirements.get('description', '') or '').lower()
-        skills = [s.lower() for s in job_requirements.get('required_skills', [])]
-
-        text = f"{title} {description} {' '.join(skills)}"
-
-        if any(term in text for term in ['software', 'developer', 'engineer', 'programming']):
-            return 'software_engineering'
-        elif any(term in text for term in ['data science', 'machine learning', 'ai', 'analytics']):
-            return 'data_science'
-        elif any(term in text for term in ['product manager', 'product owner', 'pm']):
-            return 'product_management'
-        elif any(term in text for term in ['devops', 'sre', 'infrastructure', 'cloud engineer']):
-            return 'devops'
-        else:
-            return 'default'
+        skills = job_requirements.get('required_skills') or []
+        text = ' '.join((
+            str(job_requirements.get('job_title', '') or ''),
+            str(job_requirements.get('description', '') or ''),
+            ' '.join(str(skill) for skill in skills)
+        )).lower()
+
+        for industry, keywords in self.INDUSTRY_KEYWORDS.items():
+            if any(term in text for term in keywords):
+                return industry
+        return 'default'
 
     def _analyze_experience_competitiveness(
         self,
@@ -168,18 +223,7 @@ class CompetitiveAnalyzer:
         avg_years = benchmarks['avg_years_experience']
         percentage = (total_years / avg_years * 100) if avg_years > 0 else 0
 
-        if total_years >= avg_years * 1.5:
-            level = 'highly_competitive'
-            score = 95
-        elif total_years >= avg_years:
-            level = 'competitive'
-            score = 80
-        elif total_years >= avg_years * 0.7:
-            level = 'moderately_competitive'
-            score = 60
-        else:
-            level = 'below_average'
-            score = 40
+        level, score = _competitiveness_bucket(total_years, (avg_years * 0.7, avg_years, avg_years * 1.5))
 
         return {
             'total_years': round(total_years, 1),
@@ -210,10 +254,16 @@ class CompetitiveAnalyzer:
         common_industry_skills = [s.lower() for s in benchmarks.get('common_skills', [])]
         required_job_skills = [s.lower() for s in job_requirements.get('required_skills', [])]
 
-        industry_match = len([s for s in all_candidate_skills if s in common_industry_skills])
+        candidate_skill_set = frozenset(all_candidate_skills)
+        industry_skill_set = benchmarks.get('common_skills_set')
+        if industry_skill_set is None:
+            industry_skill_set = frozenset(common_industry_skills)
+        job_skill_set = frozenset(required_job_skills)
+
+        industry_match = sum(1 for s in all_candidate_skills if s in industry_skill_set)
         industry_coverage = (industry_match / len(common_industry_skills) * 100) if common_industry_skills else 0
 
-        job_match = len([s for s in all_candidate_skills if s in required_job_skills])
+        job_match = sum(1 for s in all_candidate_skills if s in job_skill_set)
         job_coverage = (job_match / len(required_job_skills) * 100) if required_job_skills else 0
 
         overall_score = (industry_coverage * 0.4 + job_coverage * 0.6)
@@ -227,8 +277,8 @@ class CompetitiveAnalyzer:
         else:
             level = 'below_average'
 
-        missing_industry_skills = [s for s in common_industry_skills if s not in all_candidate_skills]
-        missing_job_skills = [s for s in required_job_skills if s not in all_candidate_skills]
+        missing_industry_skills = [s for s in common_industry_skills if s not in candidate_skill_set]
+        missing_job_skills = [s for s in required_job_skills if s not in candidate_skill_set]
 
         return {
             'total_skills': len(all_candidate_skills),
@@ -248,41 +298,24 @@ class CompetitiveAnalyzer:
         """Analyze education competitiveness"""
         education = resume_data.get('education', [])
 
-        education_levels = {
-            'high school': 1,
-            'associate': 2,
-            'bachelor': 3,
-            'master': 4,
-            'mba': 4,
-            'phd': 5,
-            'doctorate': 5
-        }
-
         preferred = benchmarks.get('preferred_education', 'bachelor')
-        preferred_level = education_levels.get(preferred, 3)
+        preferred_level = self.EDUCATION_LEVELS.get(preferred, 3)
 
         candidate_level = 0
         highest_degree = None
         for edu in education:
             degree = (edu.get('degree', '') or '').lower()
-            for level_name, level_value in education_levels.items():
-                if level_name in degree:
-                    if level_value > candidate_level:
-                        candidate_level = level_value
-                        highest_degree = degree
+            level_value = max(
+                (self.EDUCATION_LEVELS[level] for level in self.EDUCATION_LEVEL_PATTERN.findall(degree)),
+                default=0
+            )
+            if level_value > candidate_level:
+                candidate_level = level_value
+                highest_degree = degree
 
-        if candidate_level >= preferred_level + 1:
-            level = 'highly_competitive'
-            score = 95
-        elif candidate_level >= preferred_level:
-            level = 'competitive'
-            score = 80
-        elif candidate_level == preferred_level - 1:
-            level = 'moderately_competitive'
-            score = 60
-        else:
-            level = 'below_average'
-            score = 40
+        level, score = _competitiveness_bucket(
+            candidate_level, (preferred_level - 1, preferred_level, preferred_level + 1)
+        )
 
         return {
             'highest_degree': highest_degree or 'Not specified',
@@ -314,18 +347,9 @@ class CompetitiveAnalyzer:
             education_comp['score'] * weights['education']
         )
 
-        if competitive_score >= 85:
-            position = 'top_tier'
-            description = 'Top 10% - Highly competitive candidate'
-        elif competitive_score >= 70:
-            position = 'strong'
-            description = 'Top 25% - Strong competitive position'
-        elif competitive_score >= 55:
-            position = 'average'
-            description = 'Top 50% - Average competitive position'
-        else:
-            position = 'below_average'
-            description = 'Below average - Needs improvement'
+        position, description = MARKET_POSITIONS[
+            bisect.bisect_right(MARKET_POSITION_THRESHOLDS, competitive_score)
+        ]
 
         return {
             'score': round(competitive_score, 1),
@@ -336,22 +360,7 @@ class CompetitiveAnalyzer:
 
     def _score_to_percentile(self, score: float) -> int:
         """Convert score to percentile"""
-        if score >= 95:
-            return 99
-        elif score >= 85:
-            return 90
-        elif score >= 75:
-            return 75
-        elif score >= 65:
-            return 60
-        elif score >= 55:
-            return 50
-        elif score >= 45:
-            return 40
-        elif score >= 35:
-            return 25
-        else:
-            return 10
+        return PERCENTILES[bisect.bisect_right(PERCENTILE_THRESHOLDS, score)]
 
     def _identify_strengths_weaknesses(
         self,
@@ -416,8 +425,7 @@ class CompetitiveAnalyzer:
         experience = resume_data.get('experience', [])
         leadership_count = sum(
             1 for exp in experience
-            if any(word in (exp.get('title', '') or '').lower()
-                   for word in ['lead', 'manager', 'director', 'head', 'chief'])
+            if self.LEADERSHIP_TITLE_PATTERN.search(exp.get('title', '') or '')
         )
         if leadership_count >= 2:
             advantages.append({
@@ -484,14 +492,14 @@ class CompetitiveAnalyzer:
     ) -> Dict[str, Any]:
         """Compare candidate with others"""
         all_scores = [c.get('match_score', 0) for c in other_candidates] + [match_score]
-        all_scores_sorted = sorted(all_scores, reverse=True)
+        scores = np.array(all_scores, dtype=np.float64)
 
-        rank = all_scores_sorted.index(match_score) + 1
+        rank = int(np.count_nonzero(scores > match_score)) + 1
         total = len(all_scores)
         percentile = ((total - rank) / total * 100) if total > 1 else 100
 
-        avg_score = statistics.mean(all_scores) if all_scores else 0
-        median_score = statistics.median(all_scores) if all_scores else 0
+        avg_score = float(scores.mean())
+        median_score = float(np.median(scores))
 
         if rank <= total * 0.1:
             tier = 'top_tier'
@@ -509,7 +517,7 @@ class CompetitiveAnalyzer:
             'tier': tier,
             'score_vs_average': round(match_score - avg_score, 1),
             'score_vs_median': round(match_score - median_score, 1),
-            'top_candidate_score': all_scores_sorted[0] if all_scores_sorted else 0
+            'top_candidate_score': all_scores[int(scores.argmax())]
         }
 
     def _generate_market_insights(
@@ -537,9 +545,10 @@ class CompetitiveAnalyzer:
 
         salary_range = benchmarks.get('avg_salary_range', (0, 0))
         if salary_range[0] > 0:
-            insights.append(
-                f"Market salary range for this role: ${salary_range[0]:,} - ${salary_range[1]:,}"
+            salary_range_text = benchmarks.get('salary_range_text') or (
+                f"${salary_range[0]:,} - ${salary_range[1]:,}"
             )
+            insights.append(f"Market salary range for this role: {salary_range_text}")
 
         return insights
 
@@ -1,6 +1,13 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any, Optional
 import logging
+import multiprocessing
+import os
+import re
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +18,13 @@ except ImportError:
     PDF_AVAILABLE = False
     logger.warning("PyPDF2 not available")
 
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+    logger.warning("pypdfium2 not available, using PyPDF2 for PDF text extraction")
+
 try:
     from pdf2image import convert_from_path
     import pytesseract
@@ -34,6 +48,77 @@ except ImportError:
     OCR_PROCESSOR_AVAILABLE = False
     logger.warning("OCR processor not available")
 
+NON_WHITESPACE_PATTERN = re.compile(r'\S')
+
+def _has_text(text: str) -> bool:
+    """Whether text contains a non-whitespace character, without copying it like strip()"""
+    return NON_WHITESPACE_PATTERN.search(text) is not None
+
+PARALLEL_EXTRACTION_MIN_PAGES = 16
+PAGES_PER_EXTRACTION_TASK = 8
+
+def _count_pages(file_path: str) -> int:
+    """Number of pages in a PDF"""
+    if PDFIUM_AVAILABLE:
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    with open(file_path, 'rb') as file:
+        return len(PyPDF2.PdfReader(file).pages)
+
+def _iter_page_range(file_path: str, start: int, stop: int) -> Iterator[str]:
+    """Yield the text of pages [start, stop), using PDFium when available"""
+    if PDFIUM_AVAILABLE:
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            for i in range(start, stop):
+                page = pdf[i]
+                textpage = page.get_textpage()
+                yield textpage.get_text_range().replace('\r\n', '\n')
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        return
+
+    with open(file_path, 'rb') as file:
+        pages = PyPDF2.PdfReader(file).pages
+        for i in range(start, stop):
+            yield pages[i].extract_text() or ''
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Extract text from pages [start, stop) of a PDF, run in a worker process"""
+    return list(_iter_page_range(file_path, start, stop))
+
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+_extraction_pool_lock = threading.Lock()
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    """Get or create the shared page extraction pool
+
+    Uses the spawn start method so workers never inherit the parent's threads,
+    event loop or open database/Redis connections.
+    """
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            _extraction_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _extraction_pool
+
+def _discard_extraction_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next extraction starts a fresh one"""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is pool:
+            _extraction_pool = None
+    pool.shutdown(wait=False)
+
 class Document:
     """Simple document class to replace LangChain Document"""
     def __init__(self, page_content: str, metadata: Dict[str, Any] = None):
@@ -41,28 +126,46 @@ class Document:
         self.metadata = metadata or {}
 
 class PDFLoader:
-    """Load PDF files using PyPDF2 with OCR fallback"""
+    """Load PDF files using PDFium (or PyPDF2) with OCR fallback"""
     def __init__(self, file_path: str, enable_ocr: bool = True):
         self.file_path = file_path
         self.enable_ocr = enable_ocr and OCR_PROCESSOR_AVAILABLE
 
-    def load(self) -> List[Document]:
-        if not PDF_AVAILABLE:
-            raise ImportError("PyPDF2 not installed")
+    def iter_pages(self) -> Iterator[Document]:
+        """Yield a Document for each page with extractable text, one page at a time"""
+        if not (PDFIUM_AVAILABLE or PDF_AVAILABLE):
+            raise ImportError("Neither pypdfium2 nor PyPDF2 installed")
+
+        for i, text in enumerate(self._iter_page_texts()):
+            if _has_text(text):
+                yield Document(page_content=text, metadata={"page": i + 1, "source": "text_extraction"})
+
+    def _iter_page_texts(self) -> Iterator[str]:
+        """Extract page texts in order, fanning long PDFs out to worker processes"""
+        num_pages = _count_pages(self.file_path)
+
+        if num_pages < PARALLEL_EXTRACTION_MIN_PAGES:
+            yield from _iter_page_range(self.file_path, 0, num_pages)
+            return
 
-        docs = []
+        starts = range(0, num_pages, PAGES_PER_EXTRACTION_TASK)
+        stops = [min(start + PAGES_PER_EXTRACTION_TASK, num_pages) for start in starts]
+        pool = _get_extraction_pool()
         try:
-            with open(self.file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+            for texts in pool.map(_extract_page_range, repeat(self.file_path), starts, stops):
+                yield from texts
+        except BrokenProcessPool:
+            _discard_extraction_pool(pool)
+            raise
+
+    def load(self) -> List[Document]:
+        if not (PDFIUM_AVAILABLE or PDF_AVAILABLE):
+            raise ImportError("Neither pypdfium2 nor PyPDF2 installed")
 
-                has_text = False
-                for i, page in enumerate(pdf_reader.pages):
-                    text = page.extract_text()
-                    if text.strip():
-                        has_text = True
-                        docs.append(Document(page_content=text, metadata={"page": i + 1, "source": "text_extraction"}))
+        try:
+            docs = list(self.iter_pages())
 
-            if not has_text and self.enable_ocr:
+            if not docs and self.enable_ocr:
                 logger.info(f"No text found in PDF, attempting OCR on {self.file_path}")
                 try:
                     ocr_processor = get_ocr_processor()
@@ -73,7 +176,7 @@ class PDFLoader:
                         texts = ocr_processor.extract_text_from_pdf_images(self.file_path)
 
                         for i, text in enumerate(texts):
-                            if text.strip():
+                            if _has_text(text):
                                 docs.append(Document(
                                     page_content=text,
                                     metadata={"page": i + 1, "source": "ocr"}
@@ -99,12 +202,15 @@ class OCRPDFLoader:
         if not OCR_AVAILABLE:
             raise ImportError("OCR libraries not installed")
 
-        pages = convert_from_path(self.file_path)
-        docs = []
-        for i, img in enumerate(pages):
-            text = pytesseract.image_to_string(img)
-            docs.append(Document(page_content=text, metadata={"page": i + 1}))
-        return docs
+        workers = os.cpu_count() or 4
+        pages = convert_from_path(self.file_path, thread_count=workers)
+        if not pages:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(len(pages), workers)) as executor:
+            texts = list(executor.map(pytesseract.image_to_string, pages))
+
+        return [Document(page_content=text, metadata={"page": i + 1}) for i, text in enumerate(texts)]
 
 class TextLoader:
     """Load text files"""
@@ -136,7 +242,7 @@ def load_single_document(file_path: str) -> List[Document]:
         try:
             loader = PDFLoader(file_path)
             docs = loader.load()
-            if all(not doc.page_content.strip() for doc in docs):
+            if not any(_has_text(doc.page_content) for doc in docs):
                 raise ValueError("No text extracted by PDFLoader")
             return docs
         except Exception as e:
@@ -1,5 +1,9 @@
+import hashlib
 import json
 import re
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from typing import Dict, List, Any
 from app.utils.openai_client import OpenAIClient
 import logging
@@ -7,12 +11,46 @@ import logging
 logger = logging.getLogger(__name__)
 
 class JobDescriptionParser:
+    CACHE_SIZE = 256
+
     def __init__(self):
         self.llm = OpenAIClient()
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def parse_job_description(self, job_description: str, job_title: str) -> Dict[str, Any]:
         try:
-            prompt = f"""Analyze this job description and extract structured information.
+            return deepcopy(self._cached_job_structure(job_description, job_title))
+
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON decode error in job parsing: {e}")
+            return self._get_default_job_structure()
+        except Exception as e:
+            logger.error(f"Error parsing job description: {e}")
+            return self._get_default_job_structure()
+
+    def _cached_job_structure(self, job_description: str, job_title: str) -> Dict[str, Any]:
+        """Parse a job description once per (title, description), keyed on a digest of the text"""
+        hasher = hashlib.blake2b(job_title.encode())
+        hasher.update(b"\0")
+        hasher.update(job_description.encode())
+        cache_key = hasher.digest()
+
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return cached
+
+        cached = self._extract_job_structure(job_description, job_title)
+        with self._cache_lock:
+            self._cache[cache_key] = cached
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return cached
+
+    def _extract_job_structure(self, job_description: str, job_title: str) -> Dict[str, Any]:
+        prompt = f"""Analyze this job description and extract structured information.
 
 Job Title: {job_title}
 
@@ -34,33 +72,26 @@ Extract the following in JSON format:
 
 Return ONLY valid JSON, no additional text."""
 
-            result = self.llm.invoke(prompt, temperature=0.2).strip()
-
-            result = re.sub(r'^```json\s*', '', result)
-            result = re.sub(r'\s*```$', '', result)
+        result = self.llm.invoke(prompt, temperature=0.2).strip()
 
-            parsed_job = json.loads(result)
+        result = re.sub(r'^```json\s*', '', result)
+        result = re.sub(r'\s*```$', '', result)
 
-            return {
-                "required_skills": parsed_job.get("required_skills", []),
-                "preferred_skills": parsed_job.get("preferred_skills", []),
-                "experience_required": parsed_job.get("experience_required", 0),
-                "experience_preferred": parsed_job.get("experience_preferred", 0),
-                "education_required": parsed_job.get("education_required", ""),
-                "responsibilities": parsed_job.get("responsibilities", []),
-                "technologies": parsed_job.get("technologies", []),
-                "industry": parsed_job.get("industry", ""),
-                "job_level": parsed_job.get("job_level", ""),
-                "location_type": parsed_job.get("location_type", ""),
-                "key_requirements": parsed_job.get("key_requirements", [])
-            }
+        parsed_job = json.loads(result)
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error in job parsing: {e}")
-            return self._get_default_job_structure()
-        except Exception as e:
-            logger.error(f"Error parsing job description: {e}")
-            return self._get_default_job_structure()
+        return {
+            "required_skills": parsed_job.get("required_skills", []),
+            "preferred_skills": parsed_job.get("preferred_skills", []),
+            "experience_required": parsed_job.get("experience_required", 0),
+            "experience_preferred": parsed_job.get("experience_preferred", 0),
+            "education_required": parsed_job.get("education_required", ""),
+            "responsibilities": parsed_job.get("responsibilities", []),
+            "technologies": parsed_job.get("technologies", []),
+            "industry": parsed_job.get("industry", ""),
+            "job_level": parsed_job.get("job_level", ""),
+            "location_type": parsed_job.get("location_type", ""),
+            "key_requirements": parsed_job.get("key_requirements", [])
+        }
 
     def _get_default_job_structure(self) -> Dict[str, Any]:
         return {
@@ -76,4 +107,3 @@ Return ONLY valid JSON, no additional text."""
             "location_type": "",
             "key_requirements": []
         }
-
@@ -31,22 +31,35 @@ class JobMatcherManager:
         self._initialized = True
         logger.info("Job Matcher Manager initialized")
 
+    def encode_job_description(self, job_description: str, job_title: str) -> Dict[str, Any]:
+        """Parse a job description and normalize its skills once for matching many resumes"""
+        job_requirements = self.job_parser.parse_job_description(job_description, job_title)
+
+        return {
+            "job_requirements": job_requirements,
+            "required_skills": self.skill_matcher.prepare_skills(job_requirements.get("required_skills", [])),
+            "preferred_skills": self.skill_matcher.prepare_skills(job_requirements.get("preferred_skills", []))
+        }
+
     def match_resume_to_job(
         self,
         resume_data: Dict[str, Any],
         job_description: str,
         job_title: str,
-        company_name: Optional[str] = None
+        company_name: Optional[str] = None,
+        prepared_job: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         logger.info(f"Starting job matching for: {job_title}")
 
-        job_requirements = self.job_parser.parse_job_description(job_description, job_title)
+        if prepared_job is None:
+            prepared_job = self.encode_job_description(job_description, job_title)
+        job_requirements = prepared_job["job_requirements"]
 
         candidate_skills = resume_data.get("skills", {})
-        skill_analysis = self.skill_matcher.match_skills(
+        skill_analysis = self.skill_matcher.match_prepared_skills(
             candidate_skills,
-            job_requirements.get("required_skills", []),
-            job_requirements.get("preferred_skills", [])
+            prepared_job["required_skills"],
+            prepared_job["preferred_skills"]
         )
 
         candidate_experience = resume_data.get("experience", [])
@@ -191,6 +204,12 @@ class JobMatcherManager:
 
         return strengths
 
-def get_job_matcher():
-    return JobMatcherManager()
+_job_matcher_instance = None
+
+def get_job_matcher() -> JobMatcherManager:
+    """Get or create job matcher instance (singleton)"""
+    global _job_matcher_instance
+    if _job_matcher_instance is None:
+        _job_matcher_instance = JobMatcherManager()
+    return _job_matcher_instance
 
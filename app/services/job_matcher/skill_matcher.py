@@ -1,20 +1,45 @@
-from typing import Dict, List, Any, Set
+from typing import Dict, List, Any, Set, Tuple
 import re
 
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+PreparedSkill = Tuple[str, str, str]
+
 class SkillMatcher:
+    def prepare_skills(self, skills: List[str]) -> List[PreparedSkill]:
+        prepared = []
+        for skill in skills:
+            skill_lower = skill.lower()
+            prepared.append((skill, skill_lower, _PUNCTUATION_RE.sub('', skill_lower)))
+        return prepared
+
     def match_skills(
         self,
         candidate_skills: Dict[str, List[str]],
         required_skills: List[str],
         preferred_skills: List[str]
     ) -> Dict[str, Any]:
-        all_candidate_skills = self._flatten_candidate_skills(candidate_skills)
+        return self.match_prepared_skills(
+            candidate_skills,
+            self.prepare_skills(required_skills),
+            self.prepare_skills(preferred_skills)
+        )
 
-        required_matched = self._calculate_matches(all_candidate_skills, required_skills)
-        preferred_matched = self._calculate_matches(all_candidate_skills, preferred_skills)
+    def match_prepared_skills(
+        self,
+        candidate_skills: Dict[str, List[str]],
+        required_skills: List[PreparedSkill],
+        preferred_skills: List[PreparedSkill]
+    ) -> Dict[str, Any]:
+        all_candidate_skills = self._flatten_candidate_skills(candidate_skills)
+        candidate_normalized = [_PUNCTUATION_RE.sub('', skill) for skill in all_candidate_skills]
 
-        required_missing = [skill for skill in required_skills if not self._skill_exists(skill, all_candidate_skills)]
-        preferred_missing = [skill for skill in preferred_skills if not self._skill_exists(skill, all_candidate_skills)]
+        required_matched, required_missing = self._partition_matches(
+            required_skills, all_candidate_skills, candidate_normalized
+        )
+        preferred_matched, preferred_missing = self._partition_matches(
+            preferred_skills, all_candidate_skills, candidate_normalized
+        )
 
         required_score = (len(required_matched) / len(required_skills) * 100) if required_skills else 100
         preferred_score = (len(preferred_matched) / len(preferred_skills) * 100) if preferred_skills else 100
@@ -41,26 +66,35 @@ class SkillMatcher:
                 all_skills.update([s.lower() for s in skills if s])
         return all_skills
 
-    def _calculate_matches(self, candidate_skills: Set[str], required_skills: List[str]) -> List[str]:
+    def _partition_matches(
+        self,
+        job_skills: List[PreparedSkill],
+        candidate_skills: Set[str],
+        candidate_normalized: List[str]
+    ) -> Tuple[List[str], List[str]]:
         matched = []
-        for req_skill in required_skills:
-            if self._skill_exists(req_skill, candidate_skills):
-                matched.append(req_skill)
-        return matched
-
-    def _skill_exists(self, skill: str, candidate_skills: Set[str]) -> bool:
-        skill_lower = skill.lower()
+        missing = []
+        for skill, skill_lower, skill_normalized in job_skills:
+            if self._skill_exists(skill_lower, skill_normalized, candidate_skills, candidate_normalized):
+                matched.append(skill)
+            else:
+                missing.append(skill)
+        return matched, missing
 
+    def _skill_exists(
+        self,
+        skill_lower: str,
+        skill_normalized: str,
+        candidate_skills: Set[str],
+        candidate_normalized: List[str]
+    ) -> bool:
         if skill_lower in candidate_skills:
             return True
 
-        skill_normalized = re.sub(r'[^\w\s]', '', skill_lower)
-        for candidate_skill in candidate_skills:
-            candidate_normalized = re.sub(r'[^\w\s]', '', candidate_skill)
-            if skill_normalized == candidate_normalized:
+        for normalized in candidate_normalized:
+            if skill_normalized == normalized:
                 return True
-            if skill_normalized in candidate_normalized or candidate_normalized in skill_normalized:
+            if skill_normalized in normalized or normalized in skill_normalized:
                 return True
 
         return False
-
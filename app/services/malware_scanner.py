@@ -2,6 +2,7 @@
 Basic malware scanning for uploaded files
 """
 import os
+import re
 import hashlib
 import magic
 import logging
@@ -9,6 +10,8 @@ from typing import Dict, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+EMBEDDED_SCAN_BYTES = 1024 * 1024
+
 class MalwareScanner:
     """Basic malware scanner for uploaded files"""
 
@@ -22,6 +25,8 @@ class MalwareScanner:
         '.sh', '.run', '.apk', '.ipa'
     }
 
+    EMBEDDED_EXECUTABLE_PATTERN = re.compile(b'MZ|\x7fELF|\xfe\xed\xfa')
+
     ALLOWED_MIME_TYPES = {
         'application/pdf',
         'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
@@ -32,16 +37,16 @@ class MalwareScanner:
 
     def __init__(self):
         """Initialize malware scanner"""
-        self.magic_available = self._check_magic()
+        self.mime_magic = self._load_mime_magic()
+        self.magic_available = self.mime_magic is not None
 
-    def _check_magic(self) -> bool:
-        """Check if python-magic is available"""
+    def _load_mime_magic(self) -> Optional[magic.Magic]:
+        """Load the libmagic database once so every scan reuses it"""
         try:
-            magic.Magic()
-            return True
+            return magic.Magic(mime=True)
         except Exception:
             logger.warning("python-magic not available, MIME type checking disabled")
-            return False
+            return None
 
     def calculate_file_hash(self, file_path: str) -> str:
         """Calculate MD5 hash of file"""
@@ -55,6 +60,17 @@ class MalwareScanner:
             logger.error(f"Error calculating file hash: {e}")
             return ""
 
+    def read_file(self, file_path: str) -> Tuple[str, bytes]:
+        """Hash the whole file and keep its first megabyte in a single read pass"""
+        hash_md5 = hashlib.md5()
+        head = bytearray()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b""):
+                hash_md5.update(chunk)
+                if len(head) < EMBEDDED_SCAN_BYTES:
+                    head += chunk[:EMBEDDED_SCAN_BYTES - len(head)]
+        return hash_md5.hexdigest(), bytes(head)
+
     def check_file_extension(self, filename: str) -> Tuple[bool, str]:
         """
         Check if file extension is allowed
@@ -80,8 +96,7 @@ class MalwareScanner:
             return True, "MIME type check skipped (python-magic not available)"
 
         try:
-            mime = magic.Magic(mime=True)
-            file_type = mime.from_file(file_path)
+            file_type = self.mime_magic.from_file(file_path)
 
             if file_type in self.ALLOWED_MIME_TYPES:
                 return True, f"MIME type allowed: {file_type}"
@@ -95,21 +110,22 @@ class MalwareScanner:
             logger.error(f"Error checking MIME type: {e}")
             return True, "MIME type check failed (allowed by default)"
 
-    def check_file_hash(self, file_path: str) -> Tuple[bool, str]:
+    def check_file_hash(self, file_path: str, file_hash: Optional[str] = None) -> Tuple[bool, str]:
         """
         Check file hash against known malware database
 
         Returns:
             (is_safe, message)
         """
-        file_hash = self.calculate_file_hash(file_path)
+        if file_hash is None:
+            file_hash = self.calculate_file_hash(file_path)
 
         if file_hash in self.MALICIOUS_HASHES:
             return False, f"File matches known malware signature: {file_hash}"
 
         return True, "File hash clean"
 
-    def check_file_size(self, file_path: str, max_size_mb: int = 10) -> Tuple[bool, str]:
+    def check_file_size(self, file_path: str, max_size_mb: int = 10, file_size: Optional[int] = None) -> Tuple[bool, str]:
         """
         Check if file size is within limits
 
@@ -117,7 +133,8 @@ class MalwareScanner:
             (is_safe, message)
         """
         try:
-            file_size = os.path.getsize(file_path)
+            if file_size is None:
+                file_size = os.path.getsize(file_path)
             max_size_bytes = max_size_mb * 1024 * 1024
 
             if file_size > max_size_bytes:
@@ -132,7 +149,7 @@ class MalwareScanner:
             logger.error(f"Error checking file size: {e}")
             return False, f"Error checking file size: {str(e)}"
 
-    def check_embedded_executables(self, file_path: str) -> Tuple[bool, str]:
+    def check_embedded_executables(self, file_path: str, content: Optional[bytes] = None) -> Tuple[bool, str]:
         """
         Check for embedded executables in documents (basic check)
 
@@ -140,26 +157,26 @@ class MalwareScanner:
             (is_safe, message)
         """
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read(1024 * 1024)
-
-                suspicious_patterns = [
-                    b'MZ',
-                    b'\x7fELF',
-                    b'\xfe\xed\xfa',
-                ]
+            if content is None:
+                with open(file_path, 'rb') as f:
+                    content = f.read(EMBEDDED_SCAN_BYTES)
 
-                for pattern in suspicious_patterns:
-                    if pattern in content:
-                        return False, f"Suspicious embedded executable detected"
+            if self.EMBEDDED_EXECUTABLE_PATTERN.search(content):
+                return False, f"Suspicious embedded executable detected"
 
-                return True, "No embedded executables detected"
+            return True, "No embedded executables detected"
 
         except Exception as e:
             logger.error(f"Error checking for embedded executables: {e}")
             return True, "Embedded executable check failed (allowed by default)"
 
-    def scan_file(self, file_path: str, filename: str, max_size_mb: int = 10) -> Dict[str, any]:
+    def scan_file(
+        self,
+        file_path: str,
+        filename: str,
+        max_size_mb: int = 10,
+        file_size: Optional[int] = None
+    ) -> Dict[str, any]:
         """
         Comprehensive file scan
 
@@ -167,6 +184,7 @@ class MalwareScanner:
             file_path: Path to file to scan
             filename: Original filename
             max_size_mb: Maximum file size in MB
+            file_size: Size in bytes if already known by the caller
 
         Returns:
             {
@@ -185,7 +203,7 @@ class MalwareScanner:
         if not is_safe:
             threats.append(message)
 
-        is_safe, message = self.check_file_size(file_path, max_size_mb)
+        is_safe, message = self.check_file_size(file_path, max_size_mb, file_size)
         checks['file_size'] = {'passed': is_safe, 'message': message}
         if not is_safe:
             threats.append(message)
@@ -195,12 +213,18 @@ class MalwareScanner:
         if not is_safe:
             warnings.append(message)
 
-        is_safe, message = self.check_file_hash(file_path)
+        try:
+            file_hash, head = self.read_file(file_path)
+        except Exception as e:
+            logger.error(f"Error reading file for scan: {e}")
+            file_hash, head = None, None
+
+        is_safe, message = self.check_file_hash(file_path, file_hash)
         checks['file_hash'] = {'passed': is_safe, 'message': message}
         if not is_safe:
             threats.append(message)
 
-        is_safe, message = self.check_embedded_executables(file_path)
+        is_safe, message = self.check_embedded_executables(file_path, head)
         checks['embedded_executables'] = {'passed': is_safe, 'message': message}
         if not is_safe:
             warnings.append(message)  # Changed from threats to warnings to reduce false positives
@@ -32,8 +32,7 @@ class ResumeParserErrorLogger:
                 input_data=input_data,
                 context=context,
                 severity=severity,
-                is_resolved=False,
-                created_at=datetime.utcnow()
+                is_resolved=False
             )
 
             db.add(error_log)
@@ -68,8 +67,7 @@ class ResumeParserErrorLogger:
                 input_data=None,
                 context=context,
                 severity='warning',
-                is_resolved=False,
-                created_at=datetime.utcnow()
+                is_resolved=False
             )
 
             db.add(error_log)
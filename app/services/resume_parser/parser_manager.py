@@ -1,5 +1,4 @@
 from typing import Dict, Any, Optional
-import hashlib
 import logging
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
@@ -256,10 +255,6 @@ class ResumeParserManager:
             logger.error(f"Critical error during resume parsing: {e}")
             raise
 
-    def generate_resume_hash(self, file_content: bytes, file_name: str) -> str:
-        hash_input = file_content + file_name.encode('utf-8')
-        return hashlib.md5(hash_input).hexdigest()
-
 _parser_manager_instance = None
 
 def get_resume_parser():
@@ -0,0 +1,77 @@
+"""
+Resume processing pipeline run after upload
+"""
+from datetime import datetime
+from typing import Optional
+import asyncio
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.core.database import BackgroundSessionLocal
+from app.models.database import Resume
+from app.services.resume_parser.parser_manager import get_resume_parser
+
+async def process_resume_file(resume_id: str, file_path: str):
+    """Load, parse and store an uploaded resume, recording failures in the error log
+
+    Runs on the event loop (arq worker or FastAPI background task), so every
+    blocking step - database I/O, document loading and model loading - is
+    pushed to a thread.
+    """
+    db = BackgroundSessionLocal()
+    resume = None
+    try:
+        from app.services.document_loader import load_single_document
+
+        resume = await asyncio.to_thread(db.get, Resume, uuid.UUID(resume_id))
+        if not resume:
+            return
+
+        resume.status = 'processing'
+        await asyncio.to_thread(db.commit)
+
+        documents = await asyncio.to_thread(load_single_document, file_path)
+        if documents:
+            raw_text = " ".join([doc.page_content for doc in documents])
+            resume.raw_text = raw_text
+
+            parser = await asyncio.to_thread(get_resume_parser)
+            structured_data = await parser.parse_resume_async(raw_text, resume_id=resume_id, db=db)
+
+            resume.structured_data = structured_data
+            resume.status = 'completed'
+            resume.processed_at = datetime.utcnow()
+        else:
+            resume.status = 'failed'
+
+        await asyncio.to_thread(db.commit)
+
+    except Exception as e:
+        await asyncio.to_thread(_record_failure, db, resume, e, resume_id, file_path)
+    finally:
+        await asyncio.to_thread(db.close)
+
+def _record_failure(
+    db: Session,
+    resume: Optional[Resume],
+    error: Exception,
+    resume_id: str,
+    file_path: str
+):
+    """Mark the resume as failed (if it was loaded) and log the error"""
+    from app.services.resume_parser.error_logger import ResumeParserErrorLogger
+
+    db.rollback()
+    if resume is not None:
+        resume.status = 'failed'
+        db.commit()
+
+    # Re-raise inside this thread so the error logger's format_exc() sees the traceback
+    try:
+        raise error
+    except Exception:
+        ResumeParserErrorLogger.log_error(
+            db, error, "resume_parsing_failed", "BackgroundTask",
+            resume_id, {"file_path": file_path}, None, "critical"
+        )
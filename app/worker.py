@@ -0,0 +1,23 @@
+"""
+Background worker that parses uploaded resumes outside the API process
+
+Run with: arq app.worker.WorkerSettings
+"""
+import asyncio
+
+from arq.connections import RedisSettings
+
+from app.core.config import settings
+from app.services.resume_processor import process_resume_file
+from app.services.resume_parser.models.flair_loader import get_flair_model
+
+async def startup(ctx):
+    await asyncio.to_thread(get_flair_model)
+
+async def process_resume(ctx, resume_id: str, file_path: str):
+    await process_resume_file(resume_id, file_path)
+
+class WorkerSettings:
+    functions = [process_resume]
+    on_startup = startup
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
@@ -7,14 +7,14 @@ CREATE TABLE IF NOT EXISTS resumes (
     file_hash VARCHAR(128) UNIQUE NOT NULL,
     file_size INTEGER NOT NULL,
     file_type VARCHAR(50) NOT NULL,
-    uploaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    uploaded_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
     processed_at TIMESTAMP,
     status VARCHAR(50) DEFAULT 'pending',
     raw_text TEXT,
     structured_data JSONB,
     user_id INTEGER,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
+    updated_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc')
 );
 
 CREATE TABLE IF NOT EXISTS ai_analysis (
@@ -27,7 +27,7 @@ CREATE TABLE IF NOT EXISTS ai_analysis (
     salary_estimate JSONB,
     suggestions JSONB,
     confidence_scores JSONB,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
     FOREIGN KEY (resume_id) REFERENCES resumes(id) ON DELETE CASCADE
 );
 
@@ -48,7 +48,7 @@ CREATE TABLE IF NOT EXISTS resume_job_matches (
     competitive_advantages JSONB,
     explanation JSONB,
     processing_metadata JSONB,
-    matched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    matched_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
     FOREIGN KEY (resume_id) REFERENCES resumes(id) ON DELETE CASCADE
 );
 
@@ -63,7 +63,7 @@ CREATE TABLE IF NOT EXISTS resume_parser_error_logs (
     context JSONB,
     severity VARCHAR(20) DEFAULT 'error',
     is_resolved BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
     resolved_at TIMESTAMP,
     FOREIGN KEY (resume_id) REFERENCES resumes(id) ON DELETE CASCADE
 );
@@ -72,15 +72,21 @@ CREATE INDEX IF NOT EXISTS idx_resumes_file_hash ON resumes(file_hash);
 CREATE INDEX IF NOT EXISTS idx_resumes_user_id ON resumes(user_id);
 CREATE INDEX IF NOT EXISTS idx_resumes_status ON resumes(status);
 CREATE INDEX IF NOT EXISTS idx_resumes_uploaded_at ON resumes(uploaded_at);
-CREATE INDEX IF NOT EXISTS idx_ai_analysis_resume_id ON ai_analysis(resume_id);
+CREATE INDEX IF NOT EXISTS idx_resumes_uploaded_at_id ON resumes(uploaded_at DESC, id DESC);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_ai_analysis_resume_id_unique ON ai_analysis(resume_id);
 CREATE INDEX IF NOT EXISTS idx_resume_job_matches_resume_id ON resume_job_matches(resume_id);
 CREATE INDEX IF NOT EXISTS idx_resume_job_matches_overall_score ON resume_job_matches(overall_score);
+CREATE INDEX IF NOT EXISTS idx_resume_job_matches_resume_matched ON resume_job_matches(resume_id, matched_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_resume_job_matches_resume_score ON resume_job_matches(resume_id, overall_score DESC);
 CREATE INDEX IF NOT EXISTS idx_resumes_structured_data_gin ON resumes USING GIN (structured_data);
 CREATE INDEX IF NOT EXISTS idx_error_logs_resume_id ON resume_parser_error_logs(resume_id);
 CREATE INDEX IF NOT EXISTS idx_error_logs_error_type ON resume_parser_error_logs(error_type);
 CREATE INDEX IF NOT EXISTS idx_error_logs_severity ON resume_parser_error_logs(severity);
 CREATE INDEX IF NOT EXISTS idx_error_logs_is_resolved ON resume_parser_error_logs(is_resolved);
 CREATE INDEX IF NOT EXISTS idx_error_logs_created_at ON resume_parser_error_logs(created_at);
+CREATE INDEX IF NOT EXISTS idx_error_logs_severity_resolved_created ON resume_parser_error_logs(severity, is_resolved, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_error_logs_created_at_id ON resume_parser_error_logs(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_error_logs_resume_created ON resume_parser_error_logs(resume_id, created_at DESC);
 
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -36,6 +36,9 @@ print('ERROR: PostgreSQL did not become available in time')
 sys.exit(1)
 "
 
+echo "Initializing database tables..."
+python3 -m scripts.init_db
+
 echo "Checking ML models..."
 if [ ! -d "/app/models/flair_cache" ] || [ -z "$(ls -A /app/models/flair_cache)" ]; then
   echo "⚠️  ML models directory is empty."
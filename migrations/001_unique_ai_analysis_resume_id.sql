@@ -0,0 +1,15 @@
+-- One-off migration for databases created before ai_analysis.resume_id was unique.
+-- Quality analysis now upserts on resume_id, which needs the unique index below.
+-- This DELETES every ai_analysis row except the newest one per resume_id.
+-- Back up the table first, then run once:
+--   psql -U postgres -d hackathon -f migrations/001_unique_ai_analysis_resume_id.sql
+
+BEGIN;
+
+DELETE FROM ai_analysis a USING ai_analysis b
+    WHERE a.resume_id = b.resume_id AND (a.created_at, a.id) < (b.created_at, b.id);
+
+DROP INDEX IF EXISTS idx_ai_analysis_resume_id;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_ai_analysis_resume_id_unique ON ai_analysis(resume_id);
+
+COMMIT;
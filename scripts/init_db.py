@@ -0,0 +1,25 @@
+"""
+Create database tables for all models
+
+Run once per deployment (python -m scripts.init_db) instead of on every
+API process start.
+"""
+import logging
+import sys
+
+from app.core.database import engine, Base
+from app.models.database import Resume, ResumeJobMatch, AIAnalysis, ResumeParserErrorLog
+
+logger = logging.getLogger(__name__)
+
+def init_db():
+    Base.metadata.create_all(bind=engine)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        init_db()
+        logger.info("Database tables created successfully")
+    except Exception as e:
+        logger.error(f"Error creating database tables: {e}")
+        sys.exit(1)
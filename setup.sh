@@ -184,18 +184,7 @@ print_success "Directories created"
 # Step 9: Initialize database tables
 echo ""
 echo "Step 9: Initializing database tables..."
-python3 << EOF
-import sys
-sys.path.insert(0, '.')
-try:
-    from app.core.database import engine, Base
-    from app.models.database import Resume, ResumeJobMatch, AIAnalysis, ResumeParserErrorLog
-    Base.metadata.create_all(bind=engine)
-    print("Database tables created successfully")
-except Exception as e:
-    print(f"Error creating database tables: {e}")
-    sys.exit(1)
-EOF
+python3 -m scripts.init_db
 
 if [ $? -eq 0 ]; then
     print_success "Database tables initialized"
@@ -99,6 +99,10 @@ class TestResumeAnonymizer:
         email2 = anonymizer._anonymize_email("invalid")
         assert email2 == "candidate@anonymized.com"
 
+    def test_anonymize_email_multiple_at_signs(self, anonymizer):
+        assert anonymizer._anonymize_email("a@b@c") == "candidate@b"
+        assert anonymizer._anonymize_email("user@") == "candidate@"
+
     def test_remove_address(self, anonymizer, sample_resume):
         result = anonymizer.anonymize_resume(sample_resume)
 
@@ -127,6 +131,20 @@ class TestResumeAnonymizer:
 
         assert 'he' not in result.lower() or 'they' in result.lower()
 
+    def test_transform_fields_keeps_fields_separate(self, anonymizer):
+        experience = [
+            {"description": "She managed her team"},
+            {"description": None},
+            {"description": "He wrote\x1ehis tests"}
+        ]
+        fields = [(exp, "description") for exp in experience]
+
+        anonymizer._transform_fields(fields, anonymizer._neutralize_gendered_language)
+
+        assert experience[0]["description"] == "They managed their team"
+        assert experience[1]["description"] is None
+        assert experience[2]["description"] == "They wrote\x1etheir tests"
+
     def test_mask_education_dates(self, anonymizer, sample_resume):
         options = {'mask_education_dates': True}
         result = anonymizer.anonymize_resume(sample_resume, options)
@@ -248,6 +266,27 @@ class TestResumeAnonymizer:
         assert hash1 == hash2
         assert len(hash1) == 64
 
+    def test_repeated_anonymization_uses_cache(self, sample_resume):
+        anonymizer = ResumeAnonymizer()
+
+        result1 = anonymizer.anonymize_resume(sample_resume)
+        result1['personal_info']['full_name'] = "Changed"
+        result2 = anonymizer.anonymize_resume(sample_resume)
+
+        assert len(anonymizer._cache) == 1
+        assert result2['personal_info']['full_name'].startswith("Candidate ")
+        assert sample_resume['personal_info']['full_name'] == "John Michael Smith"
+
+    def test_unhashable_option_values(self, sample_resume):
+        anonymizer = ResumeAnonymizer()
+
+        result = anonymizer.anonymize_resume(
+            sample_resume, {'remove_name': ['yes'], 'extra': {'nested': True}}
+        )
+
+        assert result['personal_info']['full_name'].startswith("Candidate ")
+        assert result['_anonymization_metadata']['options_used']['extra'] == {'nested': True}
+
     def test_singleton_pattern(self):
         anon1 = get_anonymizer()
         anon2 = get_anonymizer()
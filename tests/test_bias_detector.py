@@ -78,6 +78,35 @@ class TestBiasDetector:
         assert 'cultural' in detector.bias_patterns
         assert 'disability' in detector.bias_patterns
 
+    def test_scan_reports_overlapping_indicators(self, detector):
+        matches = detector.scan("Professional appearance and a traditional name are required")
+
+        assert matches['appearance'] == ['Professional appearance']
+        assert matches['gender'] == ['Professional']
+        assert matches['cultural'] == ['traditional name']
+        assert matches['age'] == ['traditional']
+
+    def test_automaton_scan_matches_regex_scan(self):
+        detector = BiasDetector()
+        if detector.automaton is None:
+            pytest.skip("pyahocorasick not installed")
+
+        text = "Young, energetic guy; professional appearance and a traditional name. Private-school alumni"
+        automaton_matches = detector.scan(text)
+        detector.automaton = None
+        regex_matches = detector.scan(text)
+
+        assert {k: sorted(v) for k, v in automaton_matches.items()} == {k: sorted(v) for k, v in regex_matches.items()}
+
+    def test_scan_reports_overlapping_phrases(self):
+        detector = BiasDetector()
+        detector.automaton = None
+
+        matches = detector.scan("Looking for a digital native speaker")
+
+        assert matches['age'] == ['digital native']
+        assert matches['cultural'] == ['native speaker']
+
     def test_detect_gender_bias(self, detector, sample_resume_with_bias):
         result = detector.detect_bias_in_resume(sample_resume_with_bias)
 
@@ -158,14 +187,14 @@ class TestBiasDetector:
         assert 'gender' in result['categories_affected']
 
     def test_bias_description(self, detector):
-        desc_gender = detector._get_bias_description('gender')
+        desc_gender = detector.BIAS_DESCRIPTIONS['gender']
         assert 'gender' in desc_gender.lower()
 
-        desc_age = detector._get_bias_description('age')
+        desc_age = detector.BIAS_DESCRIPTIONS['age']
         assert 'age' in desc_age.lower()
 
     def test_bias_recommendation(self, detector):
-        rec_gender = detector._get_bias_recommendation('gender')
+        rec_gender = detector.BIAS_RECOMMENDATIONS['gender']
         assert len(rec_gender) > 0
         assert 'neutral' in rec_gender.lower()
 
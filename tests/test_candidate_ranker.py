@@ -141,6 +141,27 @@ class TestCandidateRanker:
         assert candidates[0]['final_score'] >= candidates[1]['final_score']
         assert candidates[1]['final_score'] >= candidates[2]['final_score']
 
+    def test_repeated_ranking_uses_cache(self, sample_candidates, sample_job_requirements):
+        ranker = CandidateRanker()
+
+        ranker.rank_candidates(sample_candidates, sample_job_requirements)
+        result2 = ranker.rank_candidates(sample_candidates, sample_job_requirements)
+        result2['ranked_candidates'][0]['final_score'] = -1
+        result3 = ranker.rank_candidates(sample_candidates, sample_job_requirements)
+
+        assert len(ranker._cache) == 1
+        assert result3['ranked_candidates'][0]['final_score'] >= 0
+        assert 'ranked_at' not in ranker._cache[next(iter(ranker._cache))]
+
+    def test_overlapping_pools_reuse_candidate_scores(self, sample_candidates, sample_job_requirements):
+        ranker = CandidateRanker()
+
+        ranker.rank_candidates(sample_candidates[:2], sample_job_requirements)
+        result = ranker.rank_candidates(sample_candidates[1:], sample_job_requirements)
+
+        assert len(ranker._score_cache) == 3
+        assert result['total_candidates'] == 2
+
     def test_tier_distribution(self, ranker, sample_candidates, sample_job_requirements):
         result = ranker.rank_candidates(
             candidates=sample_candidates,
@@ -256,16 +277,16 @@ class TestCandidateRanker:
         assert result['weights_used'] == custom_weights
 
     def test_interview_priority(self, ranker):
-        priority_urgent = ranker._determine_interview_priority(90, {'skills_match': 85})
+        priority_urgent = ranker._determine_interview_priority(90, 85)
         assert priority_urgent == 'urgent'
 
-        priority_high = ranker._determine_interview_priority(75, {'skills_match': 75})
+        priority_high = ranker._determine_interview_priority(75, 75)
         assert priority_high == 'high'
 
-        priority_medium = ranker._determine_interview_priority(60, {'skills_match': 60})
+        priority_medium = ranker._determine_interview_priority(60, 60)
         assert priority_medium == 'medium'
 
-        priority_low = ranker._determine_interview_priority(40, {'skills_match': 40})
+        priority_low = ranker._determine_interview_priority(40, 40)
         assert priority_low == 'low'
 
     def test_generate_recommendation(self, ranker):
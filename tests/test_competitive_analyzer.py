@@ -96,6 +96,22 @@ class TestCompetitiveAnalyzer:
         industry = analyzer._infer_industry(job_req)
         assert industry == 'product_management'
 
+    def test_infer_industry_is_case_insensitive(self, analyzer):
+        job_req = {
+            "job_title": "DEVOPS LEAD",
+            "description": "Own our cloud infrastructure",
+            "required_skills": ["terraform", "kubernetes"]
+        }
+        assert analyzer._infer_industry(job_req) == 'devops'
+
+    def test_infer_industry_nested_skills(self, analyzer):
+        job_req = {
+            "job_title": "Engineer",
+            "description": "",
+            "required_skills": [["python"], {"name": "docker"}]
+        }
+        assert analyzer._infer_industry(job_req) in analyzer.INDUSTRY_BENCHMARKS
+
     def test_analyze_competitiveness(self, analyzer, sample_resume_strong, sample_job_requirements):
         result = analyzer.analyze_competitiveness(
             resume_data=sample_resume_strong,
@@ -213,6 +229,32 @@ class TestCompetitiveAnalyzer:
             assert 'description' in advantage
             assert 'impact' in advantage
 
+    def test_leadership_titles_match_whole_words(self, analyzer):
+        resume = {
+            "experience": [
+                {"title": "Tech Lead"},
+                {"title": "Engineering Manager"},
+                {"title": "Misleading Title Specialist"}
+            ]
+        }
+        result = analyzer._identify_competitive_advantages(resume, {}, {})
+
+        leadership = [a for a in result if a['advantage'] == 'Leadership Experience']
+        assert leadership[0]['description'] == "2 leadership roles"
+
+    def test_leadership_titles_include_lead_variants(self, analyzer):
+        resume = {
+            "experience": [
+                {"title": "Team Leader"},
+                {"title": "Head of Tech Leadership"},
+                {"title": "Leading Engineer"}
+            ]
+        }
+        result = analyzer._identify_competitive_advantages(resume, {}, {})
+
+        leadership = [a for a in result if a['advantage'] == 'Leadership Experience']
+        assert leadership[0]['description'] == "3 leadership roles"
+
     def test_generate_improvement_priorities(self, analyzer):
         weaknesses = ["Limited experience (2 years gap)", "Skill gaps (3 key skills missing)"]
         benchmarks = analyzer.INDUSTRY_BENCHMARKS['software_engineering']
@@ -277,6 +319,17 @@ class TestCompetitiveAnalyzer:
         assert 'analyzed_at' in result
         assert result['analyzed_at'] is not None
 
+    def test_shared_analyzed_at_timestamp(self, analyzer, sample_resume_strong, sample_job_requirements):
+        batch_timestamp = "2025-11-04T12:00:00"
+        result = analyzer.analyze_competitiveness(
+            resume_data=sample_resume_strong,
+            job_requirements=sample_job_requirements,
+            match_score=85.0,
+            analyzed_at=batch_timestamp
+        )
+
+        assert result['analyzed_at'] == batch_timestamp
+
     def test_singleton_pattern(self):
         analyzer1 = get_competitive_analyzer()
         analyzer2 = get_competitive_analyzer()
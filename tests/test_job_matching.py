@@ -3,6 +3,7 @@ Test job matching endpoints
 """
 import pytest
 import uuid
+from datetime import datetime
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from app.models.database import Resume, ResumeJobMatch
@@ -152,6 +153,48 @@ def test_list_resume_matches(client: TestClient, auth_headers: dict, db_session:
     assert len(data) == 3
     assert all(match["resume_id"] == str(resume.id) for match in data)
 
+def test_list_resume_matches_cursor_paging(client: TestClient, auth_headers: dict, db_session: Session, sample_resume_data: dict):
+    """Test paging through a resume's matches with the X-Next-Cursor header"""
+    resume = Resume(
+        id=uuid.uuid4(),
+        file_name="test.pdf",
+        file_path="/fake/path/test.pdf",
+        file_size=1024,
+        file_type="application/pdf",
+        file_hash="hash222",
+        status="completed",
+        structured_data=sample_resume_data
+    )
+    db_session.add(resume)
+    db_session.commit()
+
+    for i in range(5):
+        job_match = ResumeJobMatch(
+            id=uuid.uuid4(),
+            resume_id=resume.id,
+            job_title=f"Position {i}",
+            job_description=f"Job {i}",
+            overall_score=80,
+            confidence_score=0.85,
+            recommendation="Good Match",
+            matched_at=datetime(2025, 1, 1 + i)
+        )
+        db_session.add(job_match)
+
+    db_session.commit()
+
+    url = f"/api/v1/jobs/resumes/{resume.id}/matches"
+    first = client.get(url, headers=auth_headers, params={"limit": 2})
+    assert [match["job_title"] for match in first.json()] == ["Position 4", "Position 3"]
+    assert "X-Next-Cursor" in first.headers
+
+    second = client.get(url, headers=auth_headers, params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert [match["job_title"] for match in second.json()] == ["Position 2", "Position 1"]
+
+    last = client.get(url, headers=auth_headers, params={"limit": 2, "cursor": second.headers["X-Next-Cursor"]})
+    assert [match["job_title"] for match in last.json()] == ["Position 0"]
+    assert "X-Next-Cursor" not in last.headers
+
 def test_delete_job_match(client: TestClient, auth_headers: dict, db_session: Session, sample_resume_data: dict):
     """Test deleting a job match"""
     resume = Resume(
@@ -209,3 +252,11 @@ def test_job_match_validation(client: TestClient, auth_headers: dict, db_session
     response = client.post("/api/v1/jobs/match", headers=auth_headers, json=match_request)
     assert response.status_code in [400, 422, 500]
 
+
+@pytest.mark.parametrize("limit", [0, -1, 201])
+def test_list_resume_matches_rejects_out_of_range_limit(client: TestClient, auth_headers: dict, limit: int):
+    """Test that page sizes outside 1..200 are rejected before querying"""
+    response = client.get(
+        f"/api/v1/jobs/resumes/{uuid.uuid4()}/matches", headers=auth_headers, params={"limit": limit}
+    )
+    assert response.status_code == 422
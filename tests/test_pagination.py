@@ -0,0 +1,32 @@
+"""
+Tests for keyset pagination cursors
+"""
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import encode_cursor, decode_cursor
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes back to the original timestamp and id"""
+    timestamp = datetime(2025, 11, 4, 12, 30, 15, 123456)
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor(timestamp, row_id)
+
+    assert decode_cursor(cursor) == (timestamp, row_id)
+
+def test_cursor_is_url_safe():
+    """Test that cursors can be passed as query parameters unescaped"""
+    cursor = encode_cursor(datetime(2025, 1, 1), uuid.uuid4())
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "YWJj", ""])
+def test_invalid_cursor_rejected(cursor):
+    """Test that malformed cursors raise a 400"""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
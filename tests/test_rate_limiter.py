@@ -0,0 +1,28 @@
+"""
+Tests for the Redis-backed rate limiter
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import redis.asyncio as redis
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.rate_limiter import RateLimitMiddleware
+
+def _request(path: str = "/api/v1/resumes/") -> Request:
+    return Request({"type": "http", "method": "GET", "path": path, "headers": [], "client": ("10.0.0.1", 1234)})
+
+def test_redis_failure_backs_off():
+    """Test that after a Redis failure the limiter stops calling Redis and fails open"""
+    middleware = RateLimitMiddleware(None, requests_per_minute=10)
+    middleware.limiter._increment = AsyncMock(side_effect=redis.ConnectionError("refused"))
+    call_next = AsyncMock(return_value=Response("ok"))
+
+    for _ in range(3):
+        response = asyncio.run(middleware.dispatch(_request(), call_next))
+        assert response.status_code == 200
+
+    assert middleware.limiter._increment.await_count == 1
+    assert call_next.await_count == 3
+    assert not middleware.limiter.available
@@ -16,6 +16,21 @@ def test_list_resumes_empty(client: TestClient, auth_headers: dict):
     assert isinstance(data, list)
     assert len(data) == 0
 
+@pytest.mark.parametrize("limit", [0, -1, 101])
+def test_list_resumes_rejects_out_of_range_limit(client: TestClient, auth_headers: dict, limit: int):
+    """Test that page sizes outside 1..100 are rejected before querying"""
+    response = client.get("/api/v1/resumes/", headers=auth_headers, params={"limit": limit})
+    assert response.status_code == 422
+
+def test_list_resumes_rejects_skip_with_cursor(client: TestClient, auth_headers: dict):
+    """Test that offset and keyset pagination can't be mixed"""
+    from datetime import datetime
+    from app.core.pagination import encode_cursor
+
+    cursor = encode_cursor(datetime(2025, 1, 1), uuid.uuid4())
+    response = client.get("/api/v1/resumes/", headers=auth_headers, params={"skip": 10, "cursor": cursor})
+    assert response.status_code == 400
+
 def test_upload_resume_missing_file(client: TestClient, auth_headers: dict):
     """Test upload without file returns error"""
     response = client.post("/api/v1/resumes/upload", headers=auth_headers)
@@ -174,3 +189,54 @@ def test_duplicate_resume_detection(client: TestClient, auth_headers: dict, db_s
         db_session.add(resume2)
         db_session.commit()
 
+
+def test_process_resume_failure_before_load(monkeypatch):
+    """Test that a failing lookup is logged without touching an unloaded resume"""
+    import asyncio
+    from unittest.mock import MagicMock
+    from app.services import resume_processor
+    from app.services.resume_parser.error_logger import ResumeParserErrorLogger
+
+    db = MagicMock()
+    db.get.side_effect = RuntimeError("database unavailable")
+    log_error = MagicMock()
+    monkeypatch.setattr(resume_processor, "BackgroundSessionLocal", lambda: db)
+    monkeypatch.setattr(ResumeParserErrorLogger, "log_error", log_error)
+
+    asyncio.run(resume_processor.process_resume_file(str(uuid.uuid4()), "missing.pdf"))
+
+    db.rollback.assert_called_once()
+    db.commit.assert_not_called()
+    db.close.assert_called_once()
+    assert log_error.call_args.args[1] is db.get.side_effect
+
+def test_upload_falls_back_when_enqueue_fails(monkeypatch, tmp_path):
+    """Test that a queue failure after commit still schedules processing in-process"""
+    import asyncio
+    from datetime import datetime
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, MagicMock
+    import redis.asyncio as redis
+    from fastapi import BackgroundTasks, UploadFile
+    from app.api.routes import resumes
+
+    db = MagicMock()
+    db.execute.return_value.one.return_value = SimpleNamespace(
+        id=uuid.uuid4(), file_name="cv.txt", status="pending", uploaded_at=datetime(2025, 1, 1), inserted=True
+    )
+    scanner = MagicMock()
+    scanner.scan_file.return_value = {"is_safe": True}
+    arq_pool = MagicMock()
+    arq_pool.enqueue_job = AsyncMock(side_effect=redis.ConnectionError("refused"))
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(arq_pool=arq_pool)))
+    background_tasks = BackgroundTasks()
+    monkeypatch.setattr(resumes, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(resumes, "get_malware_scanner", lambda: scanner)
+
+    response = asyncio.run(resumes.upload_resume(
+        request, background_tasks, UploadFile(io.BytesIO(b"resume text"), filename="cv.txt"), db, True
+    ))
+
+    assert response.status == "pending"
+    arq_pool.enqueue_job.assert_awaited_once()
+    assert [task.func for task in background_tasks.tasks] == [resumes.process_resume_file]